@@ -0,0 +1,140 @@
+# Pluto benchmarks
+# Run with: python benchmark.py <benchmark> [options], see python benchmark.py -h
+
+# MIT License
+# Copyright (c) 2022 Malik Pätzold
+
+import argparse
+import glob
+import os
+import time
+
+import pluto as pl
+
+def line_crops(folder="example images", limit=64):  # -> list
+    """Cuts the example screenshots into text line crops (the same way the NYT & Twitter slicers do)
+    """
+    crops = []
+    for path in sorted(glob.glob(os.path.join(folder, "*.jpg"))):
+        img = pl.read_image(path)
+        profile = pl.row_profile(pl.to_grayscale(img)[:, :int(img.shape[1] * 0.9)], True, 248, False)
+        for y0, y1 in pl.find_row_segments(profile, 250, 5, 8):
+            crops.append(img[y0:y1])
+            if len(crops) == limit: return crops
+    return crops
+
+class SyntheticBackend(pl.TesseractBackend):
+    """Stands in for an OCR engine that runs outside the GIL (like the Tesseract processes): every crop takes latency seconds.
+    Measures the overhead & scaling of ocr_executor itself, without an OCR engine installed
+    """
+    name = "synthetic"
+    thread_safe = True
+    
+    def __init__(self, latency=0.02):
+        super().__init__()
+        self.latency = latency
+    
+    def readtext(self, image, mode="detect", allowlist=None):  # -> list
+        time.sleep(self.latency)
+        return [str(image.shape[1])]
+
+def executor(args):
+    """OCR of independent crops, sequential vs. ocr_executor with a growing number of workers
+    """
+    crops = line_crops(limit=args.crops)
+    if args.backend == "synthetic":
+        pl.pluto_ocr.backends["synthetic"] = SyntheticBackend
+        pl.pluto_ocr.register_backend(SyntheticBackend(args.latency / 1000))
+    util = pl.PlutoObject(None)
+    util.ocr_backend = args.backend
+    util.ocr_concurrent = True
+    print(f"{len(crops)} crops, backend: {args.backend}, cores: {os.cpu_count()}")
+
+    util.ocr(crops[0], cache=False)  # load the model
+    start = time.perf_counter()
+    for crop in crops: util.ocr(crop, cache=False)
+    sequential = time.perf_counter() - start
+    print(f"{'workers':>8} {'warmup s':>9} {'run s':>8} {'speedup':>8}")
+    print(f"{'seq':>8} {'-':>9} {sequential:8.2f} {1:8.2f}")
+
+    for workers in args.workers:
+        pl.ocr_executor.shutdown()
+        pl.ocr_executor = pl.OcrExecutor(workers, max_processes=workers)
+        start = time.perf_counter()
+        for f in [util.ocr_async(crop, cache=False) for crop in crops[:workers]]: f.result()  # every worker loads its model
+        warmup = time.perf_counter() - start
+        start = time.perf_counter()
+        for f in [util.ocr_async(crop, cache=False) for crop in crops]: f.result()
+        run = time.perf_counter() - start
+        print(f"{workers:8d} {warmup:9.2f} {run:8.2f} {sequential / run:8.2f}")
+    pl.ocr_executor.shutdown()
+
+def text(args):
+    """Throughput of the OCR text post-processing (ocr_cleanup / characters_filter_strict) on short chat-like strings
+    """
+    texts = [f" Message {i} ,from\nuser{i % 97}\x0c , sent 12:{i % 60:02d} " for i in range(args.strings)]
+    util = pl.PlutoObject(None)
+    start = time.perf_counter()
+    util.ocr_cleanup_many(texts)
+    cleanup = time.perf_counter() - start
+    start = time.perf_counter()
+    for t in texts: util.characters_filter_strict(t)
+    strict = time.perf_counter() - start
+    print(f"{len(texts)} strings, ocr_cleanup: {len(texts) / cleanup:,.0f}/s, characters_filter_strict: {len(texts) / strict:,.0f}/s")
+
+def runtimes(args):
+    """Latency of every model (see pluto.model_specs) with eager PyTorch, TorchScript & ONNX Runtime on the CPU
+    """
+    import statistics
+    print(f"{'model':>48} {'runtime':>12} {'batch':>6} {'median ms':>10}")
+    for weights, (arch, model_args, img_size, cc) in pl.model_specs.items():
+        if not os.path.exists(weights): continue
+        tnsr = pl.torch.rand(args.batch, cc, img_size, img_size)
+        for runtime in ("torch", "torchscript", "onnx"):
+            if runtime != "torch" and not os.path.exists(pl.export_path(weights, runtime)): continue
+            net = pl.ModelRegistry(runtime=runtime).load(arch, weights, "cpu", model_args)
+            times = []
+            with pl.torch.no_grad():
+                for i in range(args.runs + 3):
+                    start = time.perf_counter()
+                    net(tnsr)
+                    if i >= 3: times.append(time.perf_counter() - start)  # the first runs are warmup
+            print(f"{weights:>48} {runtime:>12} {args.batch:6d} {statistics.median(times) * 1000:10.2f}")
+
+def coldstart(args):
+    """Cold start of a fresh interpreter: import pluto only (what the CLI help, the GUI & slicing workers pay) vs.
+    import pluto + loading the EasyOCR reader (what every import cost before the reader was created lazily)
+    """
+    import statistics
+    import subprocess
+    import sys
+    snippets = {"import pluto": "import pluto",
+                "import + preload()": "import pluto; pluto.preload()"}
+    probe = "import resource, time; start = time.perf_counter(); {}; print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+    print(f"{'':>20} {'median s':>9} {'max RSS MB':>11}")
+    for name, snippet in snippets.items():
+        results = []
+        for _ in range(args.runs):
+            out = subprocess.run([sys.executable, "-c", probe.format(snippet)], capture_output=True, text=True)
+            if out.returncode != 0:
+                print(f"{name:>20} failed: {out.stderr.strip().splitlines()[-1] if out.stderr.strip() else out.returncode}")
+                break
+            seconds, rss = out.stdout.split()[-2:]
+            results.append((float(seconds), int(rss) / 1024))  # ru_maxrss is in KB on Linux
+        else:
+            print(f"{name:>20} {statistics.median(r[0] for r in results):9.2f} {max(r[1] for r in results):11.0f}")
+
+benchmarks = {"executor": executor, "text": text, "runtimes": runtimes, "coldstart": coldstart}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs Pluto benchmarks.")
+    parser.add_argument("benchmark", choices=list(benchmarks), help="Which benchmark to run")
+    parser.add_argument("--backend", type=str, default="easyocr", metavar="", help="OCR backend (easyocr, tesseract, tesseract_pool, or synthetic for the executor benchmark)")
+    parser.add_argument("--latency", type=float, default=20, metavar="", help="ms per crop of the synthetic backend")
+    parser.add_argument("--crops", type=int, default=64, metavar="", help="Number of text line crops")
+    parser.add_argument("--strings", type=int, default=1000000, metavar="", help="Number of strings for the text benchmark")
+    parser.add_argument("--batch", type=int, default=1, metavar="", help="Batch size for the runtimes benchmark")
+    parser.add_argument("--runs", type=int, default=20, metavar="", help="Timed runs per model for the runtimes benchmark (fresh interpreters for coldstart)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], metavar="", help="Worker counts to compare")
+    args = parser.parse_args()
+    benchmarks[args.benchmark](args)
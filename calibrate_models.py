@@ -0,0 +1,93 @@
+# Calibrates & writes the int8 versions of Pluto's classifiers (see pluto.quantize_model()) and reports their accuracy & latency
+# Run with: python calibrate_models.py [--folder "example images"] [--report models/quantization_report.md]
+
+# MIT License
+# Copyright (c) 2022 Malik Pätzold
+
+import argparse
+import glob
+import os
+import statistics
+import time
+
+import pluto as pl
+
+def crops(folder: str, limit: int):  # -> list
+    """Parts of the example screenshots, cut at bright rows like the slicers of the classes do (text blocks, images, headers),
+    plus the full screenshots
+    """
+    out = []
+    for path in sorted(glob.glob(os.path.join(folder, "*.jpg")) + glob.glob(os.path.join(folder, "*.png"))):
+        img = pl.read_image(path)
+        out.append(img)
+        profile = pl.row_profile(pl.to_grayscale(img)[:, :int(img.shape[1] * 0.9)], True, 248, False)
+        out += [img[y0:y1] for y0, y1 in pl.find_row_segments(profile, 250, 5, 8)]
+        if len(out) >= limit: break
+    return out[:limit]
+
+def batches(util, imgs: list, img_size: int, cc: int, batch_size: int):  # -> list
+    # the same preprocessing as PlutoObject.classify_batch()
+    if cc == 1: imgs = [pl.to_grayscale(img) for img in imgs]
+    # the tensors share the input buffer, so they're copied to be kept
+    return [util.to_tensor_batch(imgs[i:i + batch_size], img_size, pl.torch.float32, "cpu", cc).clone() for i in range(0, len(imgs), batch_size)]
+
+def latency(net, tnsr, runs: int):  # -> float
+    """Median time of a forward pass in ms, after 3 warmup runs
+    """
+    times = []
+    with pl.torch.no_grad():
+        for i in range(runs + 3):
+            start = time.perf_counter()
+            net(tnsr)
+            if i >= 3: times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+def predict(net, tnsrs: list):  # -> list
+    with pl.torch.no_grad():
+        return [int(c) for tnsr in tnsrs for c in pl.torch.argmax(net(tnsr), dim=1)]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrates the int8 classifiers on example screenshots and reports accuracy & latency.")
+    parser.add_argument("--folder", type=str, default="example images", metavar="", help="Folder with the calibration screenshots")
+    parser.add_argument("--crops", type=int, default=512, metavar="", help="Maximum number of crops (half for calibration, half for evaluation)")
+    parser.add_argument("--batch", type=int, default=8, metavar="", help="Batch size for calibration & latency")
+    parser.add_argument("--runs", type=int, default=20, metavar="", help="Timed runs per model")
+    parser.add_argument("--report", type=str, default="models/quantization_report.md", metavar="", help="Path of the markdown report")
+    args = parser.parse_args()
+
+    imgs = crops(args.folder, args.crops)
+    # alternating split, so both halves cover every screenshot
+    calibration, evaluation = imgs[0::2], imgs[1::2]
+    print(f"{len(calibration)} calibration & {len(evaluation)} evaluation crops from {args.folder}")
+    util = pl.PlutoObject(None)
+
+    rows = []
+    for weights, (arch, model_args, img_size, cc) in pl.model_specs.items():
+        if not getattr(arch, "quantizable", False): continue
+        if not os.path.exists(weights):
+            print(f"Pluto WARNING - {weights} not found, skipped.")
+            continue
+        net = pl.ModelRegistry().load(arch, weights, "cpu", model_args)
+        quantized = pl.quantize_model(net, batches(util, calibration, img_size, cc, args.batch))
+        example = pl.torch.zeros(1, cc, img_size, img_size)
+        pl.torch.jit.save(pl.torch.jit.trace(quantized, example), pl.quantized_path(weights))
+        quantized = pl.torch.jit.load(pl.quantized_path(weights))
+
+        # no labels for the crops, the float model's predictions are the reference
+        tnsrs = batches(util, evaluation, img_size, cc, args.batch)
+        reference, predicted = predict(net, tnsrs), predict(quantized, tnsrs)
+        agreement = sum(r == p for r, p in zip(reference, predicted)) / max(len(reference), 1)
+        tnsr = pl.torch.rand(args.batch, cc, img_size, img_size)
+        rows.append((weights, agreement, latency(net, tnsr[:1], args.runs), latency(quantized, tnsr[:1], args.runs),
+                     latency(net, tnsr, args.runs), latency(quantized, tnsr, args.runs),
+                     os.path.getsize(weights) / 2**20, os.path.getsize(pl.quantized_path(weights)) / 2**20))
+
+    header = ["model", "agreement", "float ms (1)", "int8 ms (1)", f"float ms ({args.batch})", f"int8 ms ({args.batch})", "float MB", "int8 MB"]
+    lines = ["| " + " | ".join(header) + " |", "|" + " --- |" * len(header)]
+    for weights, agreement, *numbers in rows:
+        lines.append(f"| {weights} | {agreement:.1%} | " + " | ".join(f"{n:.2f}" for n in numbers) + " |")
+    report = "\n".join(lines)
+    print(report)
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w") as out:
+        out.write(f"# Int8 quantization report\n\nCalibrated on {len(calibration)} crops of {args.folder}, agreement with the float model on {len(evaluation)} other crops.\n\n{report}\n")
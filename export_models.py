@@ -0,0 +1,27 @@
+# Exports Pluto's models to TorchScript & ONNX (see pluto.export_model())
+# Run with: python export_models.py [--runtimes torchscript onnx] [--models models/general_1.pt ...]
+
+# MIT License
+# Copyright (c) 2022 Malik Pätzold
+
+import argparse
+import os
+
+import pluto as pl
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exports Pluto's models to frozen TorchScript and ONNX.")
+    parser.add_argument("--models", type=str, nargs="+", default=list(pl.model_specs), metavar="", help="Weights of the models to export, default is all of pluto.model_specs")
+    parser.add_argument("--runtimes", type=str, nargs="+", default=["torchscript", "onnx"], choices=list(pl.export_suffixes), metavar="", help="Formats to export (torchscript, onnx)")
+    parser.add_argument("--opset", type=int, default=17, metavar="", help="ONNX opset version")
+    args = parser.parse_args()
+
+    for weights in args.models:
+        if weights not in pl.model_specs:
+            print(f"Pluto WARNING - {weights} is not in pluto.model_specs, skipped.")
+            continue
+        if not os.path.exists(weights):
+            print(f"Pluto WARNING - {weights} not found, skipped.")
+            continue
+        arch, model_args, img_size, cc = pl.model_specs[weights]
+        for path in pl.export_model(arch, weights, model_args, img_size, cc, args.runtimes, args.opset): print(path)
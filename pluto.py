@@ -14,12 +14,16 @@ import torch.nn as nn
 import torchvision.transforms.functional as tf
 import torch.nn.functional as F
 
+import os
 import time
+import string
+import re
 import webbrowser
 import requests
+from collections import OrderedDict
 
-import easyocr
-reader = easyocr.Reader(['en'])
+import pluto_ocr
+from pluto_ocr import OcrBackend, EasyOcrBackend, TesseractBackend, get_backend, configure_ocr, get_reader, preload, release, clean_text, clean_texts, filter_strict
 
 # For reproducibility
 seed = 3
@@ -36,6 +40,10 @@ if __name__ == "__main__":
     parser.add_argument("-i", "--input", type=str, metavar="", help="Path to input image. If left empty, the clipboard content will be used automatically")
     parser.add_argument("-o", "--output", type=str, metavar="", help="Path to where the output file should be saved.")
     parser.add_argument("-c", "--category", type=str, metavar="", help="Category of media. Equal to class name")
+    parser.add_argument("--ocr-lang", type=str, metavar="", help="Comma separated EasyOCR language codes, default is en")
+    parser.add_argument("--ocr-model-dir", type=str, metavar="", help="Directory the EasyOCR models are stored in / downloaded to")
+    parser.add_argument("--runtime", type=str, default="torch", choices=["torch", "torchscript", "onnx"], metavar="", help="Model runtime: torch, torchscript or onnx (needs the exported models, see export_models.py)")
+    parser.add_argument("--int8", action="store_true", help="Int8 quantized CPU inference for the classifiers (see calibrate_models.py)")
     args = parser.parse_args()
 
     arg_i = args.input
@@ -48,6 +56,12 @@ if __name__ == "__main__":
     # print(arg_c)
 # except Exception: pass
 
+def __getattr__(name):
+    # pluto.reader used to be created at import, keep it available
+    if name == "reader": return get_reader()
+    if name in ("ocr_languages", "ocr_model_dir"): return getattr(pluto_ocr, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def read_image(path: str, no_BGR_correction=False, resz=None):  # -> np.ndarray
     """Returns an image from a path as a numpy array, resizes it if necessary
     
@@ -97,11 +111,7 @@ def avg_of_row(img: np.ndarray, row: int, ovo=False):  # -> int | float
     Returns:
         The average value per row, ether one value only or per color channel value
     """
-    all_values_added = 0
-    if img.shape[2] == 3: all_values_added = [0, 0, 0]
-    length = len(img)
-    for pixl in img[row]: all_values_added += pixl
-    out = all_values_added / length
+    out = img[row].sum(axis=0, dtype=np.float64) / len(img)
     if ovo: out = sum(out) / 3
     return out
 
@@ -116,15 +126,11 @@ def avg_of_collum(img: np.ndarray, collum: int, ovo=False):  # -> int | float
     Returns:
         The average value per collum, ether one value only or per color channel value
     """
-    all_values_added = 0
-    if img.shape[2] == 3: all_values_added = [0, 0, 0]
-    length = len(img[0])
-    for pixl in img[:, collum]: all_values_added += pixl
-    out = all_values_added / length
+    out = img[:, collum].sum(axis=0, dtype=np.float64) / len(img[0])
     if ovo: out = sum(out) / 3
     return out
 
-def trimm_and_blur(inpt: np.ndarray, less: bool, value: int, blurs, trimm, double_down=False, invert=None, remove_color=False, remove_value=np.ndarray([0,0,0])):
+def trimm_and_blur(inpt: np.ndarray, less: bool, value: int, blurs, trimm, double_down=False, invert=None, remove_color=False, remove_value=np.ndarray([0,0,0]), out=None):
     """Isolates parts of an image with a specific color or color range. Also capable of removing color and bluring the output.
     
     Args:
@@ -137,6 +143,7 @@ def trimm_and_blur(inpt: np.ndarray, less: bool, value: int, blurs, trimm, doubl
         invert: pixel value for non-isolated areas (as list of values, representing the colors of a pixel)
         remove_color: When True, all color pixel will be overridden
         remove_value: new pixel value for color pixel
+        out: optional buffer (same shape & dtype as inpt) the result is written to. inpt itself is never modified.
     
     Returns:
         A np.ndarray with dimensions of the inpt image
@@ -153,23 +160,21 @@ def trimm_and_blur(inpt: np.ndarray, less: bool, value: int, blurs, trimm, doubl
     -> Now a trimm is also applied to the non-isolated parts of an image. If a pixel has the values [14, 21, 3], it will be overridden to [255, 255, 255].\
         A pixel with the values [16, 10, 12] will be overridden to [0, 0, 0].
     """
-    for i in range(len(inpt)):
-        for j in range(len(inpt[i])):
-            if remove_color:
-                if np.max(inpt[i][j]) - np.min(inpt[i][j]) > 2:
-                    inpt[i][j] = remove_value            
-            if less:
-                if inpt[i][j][0] > value or inpt[i][j][1] > value or inpt[i][j][2] > value:
-                    inpt[i][j] = np.array(trimm)
-                elif double_down:
-                    inpt[i][j] = np.array(invert)
-            else:
-                if inpt[i][j][0] < value or inpt[i][j][1] < value or inpt[i][j][2] < value:
-                    inpt[i][j] = np.array(trimm)
-                elif double_down:
-                    inpt[i][j] = np.array(invert)
-    blur = cv2.blur(inpt, blurs)
-    return blur
+    if out is None: out = inpt.copy()
+    elif out is not inpt: np.copyto(out, inpt)
+    
+    if remove_color:
+        color = (out.max(axis=2) - out.min(axis=2)) > 2
+        out[color] = remove_value
+    
+    # a pixel is trimmed as soon as one of the first three channels passes the threshold
+    if less: isolated = (out[:, :, :3] > value).any(axis=2)
+    else: isolated = (out[:, :, :3] < value).any(axis=2)
+    
+    if double_down: out[~isolated] = np.array(invert)
+    out[isolated] = np.array(trimm)
+    
+    return cv2.blur(out, blurs, dst=out)
 
 def to_grayscale(img: np.ndarray): # -> np.ndarray
     """Converts a color image to grayscale.
@@ -226,8 +231,191 @@ def iso_grayscale(img: np.ndarray, less_than, value, convert_grayscale=False, bl
     if inverse: return img, inv
     return img
 
+def row_profile(image: np.ndarray, full=False, value=200, bigger_than=True):  # -> np.ndarray
+    """Projects a grayscale image onto its rows in one vectorized pass.
+    The result is what column 0 of expand_to_rows() would contain, without building the 2D mask.
+    
+    Args:
+        image: An grayscale image as np.ndarray.
+        full: If False, only the upper half of the image is checked (the lower half is 0)
+        value: Threshold for the pixel values
+        bigger_than: Expand rows with a pixel bigger than value to 255 (else: smaller than value to 0)
+    
+    Returns:
+        A 1D np.ndarray with one value per row (same dtype as image).
+    """
+    rows = image.shape[0] if full else int(image.shape[0] / 2)
+    
+    if bigger_than:
+        hit = (image[:rows] > value).any(axis=1)
+        fill = 255
+    else:
+        hit = (image[:rows] < value).any(axis=1)
+        fill = 0
+    
+    profile = np.zeros(image.shape[0], image.dtype)
+    profile[:rows] = np.where(hit, fill, image[:rows, 0])
+    return profile
+
+def resize_profile(profile: np.ndarray, length: int):  # -> np.ndarray
+    """Resizes a row profile (see row_profile()) to a new image height, interpolating like cv2.resize()
+    """
+    return cv2.resize(profile.reshape(-1, 1), (1, length)).reshape(-1)
+
+def find_row_boundaries(profile: np.ndarray, hi=250, lo=5, edges="both", first=1):  # -> np.ndarray
+    """Finds the rows where a row profile (see row_profile()) switches between bright and dark.
+    Row i is always compared with row i-1 (row 0 with the last row, like python indexing).
+    
+    Args:
+        profile: 1D row profile
+        hi: Values above hi count as bright
+        lo: Values below lo count as dark
+        edges: "rising" (bright after dark), "falling" (dark after bright) or\
+               "both" (bright after dark, or not bright after not dark)
+        first: First row that is checked
+    
+    Returns:
+        A 1D np.ndarray with the row indices of the boundaries
+    """
+    cur = profile[first:]
+    prev = np.roll(profile, 1)[first:]
+    
+    if edges == "rising": hit = (cur > hi) & (prev < lo)
+    elif edges == "falling": hit = (prev > hi) & (cur < lo)
+    else: hit = ((cur > hi) & (prev < lo)) | ((cur < hi) & (prev > lo))
+    
+    return np.flatnonzero(hit) + first
+
+def find_row_segments(profile: np.ndarray, hi=250, lo=5, min_len=0, edges="both", first=1, chain=False, start=None, end=None):  # -> np.ndarray
+    """Splits a row profile (see row_profile()) into (start, end) row segments.
+    
+    Args:
+        profile: 1D row profile
+        hi, lo, edges, first: see find_row_boundaries()
+        min_len: Segments with less rows are dropped
+        chain: If False, boundaries are used in pairs (start of a run, end of a run),\
+               if True every boundary ends the previous segment and starts the next one
+        start: optional row that is added as the first boundary
+        end: optional row that is added as the last boundary
+    
+    Returns:
+        A np.ndarray of shape (segments, 2) with start and end row of every segment
+    """
+    bounds = find_row_boundaries(profile, hi, lo, edges, first)
+    if start is not None: bounds = np.insert(bounds, 0, start)
+    if end is not None: bounds = np.append(bounds, end)
+    
+    if chain: segments = np.stack((bounds[:-1], bounds[1:]), axis=1)
+    else:
+        pairs = len(bounds) // 2 * 2
+        segments = np.stack((bounds[:pairs:2], bounds[1:pairs:2]), axis=1)
+    
+    return segments[segments[:, 1] - segments[:, 0] >= min_len]
+
+def text_line_count(img: np.ndarray, contrast=60, gap=2):  # -> int
+    """Counts the bands of rows that contain text (rows with a high contrast), gaps of up to gap rows don't split a band.
+    
+    Args:
+        img: color or grayscale image
+        contrast: minimal difference between the darkest & the brightest pixel of a text row
+        gap: maximal number of text-free rows inside one line of text (e.g. between accents and letters)
+    
+    Returns:
+        The number of text lines
+    """
+    gray = img if img.ndim == 2 else to_grayscale(img)
+    ink = np.flatnonzero(gray.max(axis=1).astype(np.int16) - gray.min(axis=1) > contrast)
+    if len(ink) == 0: return 0
+    return int(np.count_nonzero(np.diff(ink) > gap + 1)) + 1
+
+def estimate_x_height(img: np.ndarray, contrast=60):  # -> float | None
+    """Estimates the x-height (height of lowercase letters) of the text in an image from its row profile.
+    Pixels that differ from the background (the median) by more than contrast count as text. Within every band of text rows,
+    the rows with at least half the maximal amount of text pixels are the x-height part (ascenders & descenders are thinner).
+    Lines without a blank row in between form one band, every run of x-height rows in it is counted as a line of its own.
+    
+    Args:
+        img: color or grayscale image
+        contrast: minimal difference between text & background
+    
+    Returns:
+        The median x-height of all text lines in pixels, None if there is no text
+    """
+    gray = img if img.ndim == 2 else to_grayscale(img)
+    if gray.size == 0: return None
+    ink = np.abs(gray.astype(np.int16) - int(np.median(gray))) > contrast
+    counts = ink.sum(axis=1)
+    rows = np.flatnonzero(counts > 0)
+    if len(rows) == 0: return None
+    # bands of consecutive text rows
+    splits = np.flatnonzero(np.diff(rows) > 1) + 1
+    heights = []
+    for band in np.split(rows, splits):
+        core = band[counts[band] >= counts[band].max() / 2]
+        heights += [len(run) for run in np.split(core, np.flatnonzero(np.diff(core) > 1) + 1)]
+    return float(np.median(heights))
+
+def scale_for_ocr(img: np.ndarray, x_height=20, tolerance=0.2, limits=(0.25, 4.0)):  # -> tuple[np.ndarray, float]
+    """Rescales an image so its text has the given x-height, e.g. to downscale Retina screenshots or upscale tiny crops before OCR.
+    
+    Args:
+        img: the image
+        x_height: target x-height in pixels
+        tolerance: images within this relative distance to the target are not resized
+        limits: minimal & maximal scale factor
+    
+    Returns:
+        The (rescaled) image & the scale factor. Coordinates in the rescaled image divided by the factor are coordinates in img.
+    """
+    current = estimate_x_height(img)
+    if current is None or current == 0: return img, 1.0
+    scale = min(max(x_height / current, limits[0]), limits[1])
+    if abs(scale - 1) < tolerance: return img, 1.0
+    size = (max(1, round(img.shape[1] * scale)), max(1, round(img.shape[0] * scale)))
+    return cv2.resize(img, size, interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC), scale
+
+class Segment:
+    """Rows of a parent image, stored as a (start, end) range or as a boolean row mask, instead of a copied list of rows.
+    
+    Args:
+        parent: The image the rows belong to
+        start, end: Row range (python slice semantics)
+        mask: Boolean np.ndarray with one value per row of parent (used instead of start & end)
+    """
+    def __init__(self, parent: np.ndarray, start=None, end=None, mask=None):
+        self.parent = parent
+        self.start = start
+        self.end = end
+        self.mask = mask
+        self._img = None
+    
+    @classmethod
+    def from_mask(cls, parent: np.ndarray, mask: np.ndarray):  # -> Segment
+        """Creates a segment from a boolean row mask, falling back to a row range if the selected rows are contiguous
+        """
+        indx = np.flatnonzero(mask)
+        if len(indx) == 0: return cls(parent, 0, 0)
+        if indx[-1] - indx[0] + 1 == len(indx): return cls(parent, indx[0], indx[-1] + 1)
+        return cls(parent, mask=mask)
+    
+    def contiguous(self):  # -> bool
+        return self.mask is None
+    
+    def image(self):  # -> np.ndarray
+        """The rows as np.ndarray. Contiguous rows are a view into the parent, others are copied once with np.take
+        """
+        if self._img is None:
+            if self.mask is None: self._img = self.parent[self.start:self.end]
+            else: self._img = np.take(self.parent, np.flatnonzero(self.mask), axis=0)
+        return self._img
+    
+    def __len__(self):
+        if self.mask is not None: return int(np.count_nonzero(self.mask))
+        return len(self.image())
+
 def expand_to_rows(image: np.ndarray, full=False, value=200, bigger_than=True):  # -> np.ndarray
         """If one value in a row (of a mask, for example) is above a specific threshold, the whole row is expanded to a specific value.
+        Only use this when the full 2D mask is needed, row_profile() is enough for reading single rows.
         
         Args:
             image: An grayscale image as np.ndarray.
@@ -235,26 +423,11 @@ def expand_to_rows(image: np.ndarray, full=False, value=200, bigger_than=True):
         Returns:
             A np.ndarray of the edited image.
         """
-        dimensions = image.shape
-        imglen = dimensions[0]
+        rows = image.shape[0] if full else int(image.shape[0] / 2)
         
-        white_row = np.array([255 for k in range(dimensions[1])])
-        black_row = np.array([0 for k in range(dimensions[1])])
-        
-        if not full: imglen = dimensions[0] / 2
-        if bigger_than:
-            for i in range(int(imglen)):
-                for j in range(dimensions[1]):
-                    if image[i][j] > value:
-                        image[i] = white_row
-        else:
-            for i in range(int(imglen)):
-                for j in range(dimensions[1]):
-                    if image[i][j] < value:
-                        image[i] = black_row
-        for i in range(int(imglen), dimensions[0]):
-            for j in range(dimensions[1]):
-                image[i] = black_row
+        if bigger_than: image[:rows][(image[:rows] > value).any(axis=1)] = 255
+        else: image[:rows][(image[:rows] < value).any(axis=1)] = 0
+        image[rows:] = 0
         return image
 
 def google(query: str):
@@ -267,6 +440,7 @@ def google(query: str):
 
 import warnings
 import functools
+import weakref
 
 def deprecated(func):
     """
@@ -286,10 +460,768 @@ def deprecated(func):
         return func(*args, **kwargs)
     return new_func
 
+class Theme:
+    """Brightness statistics of the border of a screenshot, used to tell light and dark mode apart.
+    Only a thin strip along each edge is read (width: 2% of the image height, at least 1 pixel).
+    
+    Args:
+        img: The screenshot as np.ndarray (color or grayscale)
+        width: Width of the border strips relative to the image height
+    """
+    def __init__(self, img: np.ndarray, width=0.02):
+        w = max(1, int(img.shape[0] * width))
+        self.width = w
+        self.left_rows = img[:, :w].reshape(img.shape[0], -1).mean(axis=1)
+        self.right_rows = img[:, -w:].reshape(img.shape[0], -1).mean(axis=1)
+        self.top = float(img[:w].mean())
+        self.bottom = float(img[-w:].mean())
+        self.left_cumsum = np.cumsum(self.left_rows)
+    
+    def left(self, fraction=1.0):  # -> float
+        """Average brightness of the left strip, only the top fraction of rows is taken into account
+        """
+        rows = max(1, int(len(self.left_rows) * fraction))
+        return float(self.left_cumsum[rows - 1] / rows)
+    
+    def right(self):  # -> float
+        return float(self.right_rows.mean())
+    
+    def border(self):  # -> float
+        """Average brightness of all four border strips
+        """
+        return (self.top + self.bottom + float(self.left_rows.mean()) + self.right()) / 4
+    
+    def dark(self, threshold=125):  # -> bool
+        return self.border() < threshold
+
+def background_color(img: np.ndarray):  # -> tuple
+    """The median color of the outermost rows & columns of an image, e.g. to pad a text crop with its background.
+    
+    Returns:
+        tuple with one value per channel, usable as value of cv2.copyMakeBorder()
+    """
+    border = np.concatenate([img[0], img[-1], img[:, 0], img[:, -1]]).reshape(-1, 1 if img.ndim == 2 else img.shape[2])
+    return tuple(float(v) for v in np.median(border, axis=0))
+
+def locate_view(crop: np.ndarray, base: np.ndarray):  # -> tuple | None
+    """Finds the area of base a crop (a view made by slicing base) covers, without comparing pixels.
+    
+    Returns:
+        (y0, y1, x0, x1) or None if crop is not a view into base
+    """
+    if not isinstance(crop, np.ndarray) or not isinstance(base, np.ndarray) or crop.size == 0: return None
+    if crop.dtype != base.dtype or crop.ndim != base.ndim or crop.strides[:2] != base.strides[:2]: return None
+    offset = crop.__array_interface__["data"][0] - base.__array_interface__["data"][0]
+    if offset < 0: return None
+    y0, rest = divmod(offset, base.strides[0])
+    x0, rest = divmod(rest, base.strides[1])
+    if rest != 0: return None
+    y1, x1 = y0 + crop.shape[0], x0 + crop.shape[1]
+    if y1 > base.shape[0] or x1 > base.shape[1]: return None
+    return y0, y1, x0, x1
+
+class TextBoxes:
+    """The text lines found by one OCR pass over a screenshot, stored compactly: boxes as int32 array, confidences as float32 array.
+    
+    Args:
+        items: list of [x0, y0, x1, y1, text, confidence], boxes in screenshot coordinates
+    """
+    def __init__(self, items):
+        self.boxes = np.array([item[:4] for item in items], dtype=np.int32).reshape(-1, 4)
+        self.text = [item[4] for item in items]
+        self.conf = np.array([item[5] for item in items], dtype=np.float32)
+        self.cy = (self.boxes[:, 1] + self.boxes[:, 3]) / 2
+        self.cx = (self.boxes[:, 0] + self.boxes[:, 2]) / 2
+    
+    def text_in(self, y0, y1, x0=0, x1=None, rows=None):  # -> list
+        """The text of the boxes with their center inside the area, in reading order of the OCR backend.
+        If rows (an array of row indices) is given, the center row must also be one of them.
+        """
+        inside = (self.cy >= y0) & (self.cy < y1) & (self.cx >= x0)
+        if rows is not None: inside &= np.isin(self.cy.astype(np.intp), rows)
+        if x1 is not None: inside &= self.cx < x1
+        return [self.text[i] for i in np.flatnonzero(inside)]
+    
+    def __len__(self):
+        return len(self.text)
+
+class ScreenshotContext:
+    """Lazily computes and caches the images derived from one screenshot (grayscale, inverted, row / column profiles, theme),
+    so each of them is built at most once per analysis. The screenshot must not be modified while the context is in use.
+    The context only keeps a weak reference to the screenshot: once it's garbage collected, img is None and
+    the callbacks in listeners are called with the context (used to drop it from caches).
+    
+    Args:
+        img: The screenshot as np.ndarray (color or grayscale)
+        parent: Context of the screenshot img was cut out of (optional)
+        rows: (start, end) rows of img inside the parent screenshot, or an np.ndarray with the parent row of every row of img
+    """
+    def __init__(self, img: np.ndarray, parent=None, rows=None):
+        self.ref = weakref.ref(img, self.dropped)
+        self.parent = parent
+        self.rows = rows
+        self.cache = {}
+        self.listeners = []
+    
+    @property
+    def img(self):  # -> np.ndarray
+        return self.ref()
+    
+    def dropped(self, ref):
+        for callback in self.listeners: callback(self)
+    
+    def child(self, key, img: np.ndarray, rows):  # -> ScreenshotContext
+        # contexts of cut out images are cached until the cut out image is garbage collected
+        ctx = self.cache.get(key)
+        if ctx is not None and ctx.img is img: return ctx
+        ctx = self.cache[key] = ScreenshotContext(img, self, rows)
+        ctx.listeners.append(lambda c: self.cache.pop(key) if self.cache.get(key) is c else None)
+        return ctx
+    
+    def cached(self, key, build):
+        """Returns the cached value for key, build() is only called the first time
+        """
+        if key not in self.cache: self.cache[key] = build()
+        return self.cache[key]
+    
+    def crop_rows(self, start, end):  # -> (np.ndarray, ScreenshotContext)
+        """Returns the rows start:end of the screenshot and their context.
+        Its grayscale & inverted images are views into the ones of this context.
+        The context is only kept as long as the returned image is referenced.
+        """
+        key = ("rows", start, end)
+        ctx = self.cache.get(key)
+        img = ctx.img if ctx is not None else None
+        if img is None: img = self.img[start:end]
+        return img, self.child(key, img, (start, end))
+    
+    def take_rows(self, rows: np.ndarray):  # -> (np.ndarray, ScreenshotContext)
+        """Returns the (not contiguous) rows of the screenshot, given as row indices, and their context.
+        The image is a copy (np.take), its grayscale & inverted images are taken from the ones of this context.
+        The context is only kept as long as the returned image is referenced.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        key = ("take", rows.tobytes())
+        ctx = self.cache.get(key)
+        img = ctx.img if ctx is not None else None
+        if img is None: img = np.take(self.img, rows, axis=0)
+        return img, self.child(key, img, rows)
+    
+    def from_parent(self, arr: np.ndarray):  # -> np.ndarray
+        # the rows of this context, cut out of an image derived from the parent screenshot
+        if isinstance(self.rows, tuple): return arr[self.rows[0]:self.rows[1]]
+        return np.take(arr, self.rows, axis=0)
+    
+    def to_root(self, y0, y1, x0, x1):  # -> tuple
+        """Maps an area of this screenshot to the screenshot it was (indirectly) cut out of
+        
+        Returns:
+            (context of the root screenshot, y0, y1, x0, x1, rows). If a context on the way was made with take_rows(),
+            y0:y1 is the range spanned by the area and rows the np.ndarray of the root rows it actually covers, otherwise rows is None
+        """
+        ctx, rows = self, None
+        while ctx.parent is not None:
+            if isinstance(ctx.rows, tuple):
+                y0, y1 = y0 + ctx.rows[0], y1 + ctx.rows[0]
+                if rows is not None: rows = rows + ctx.rows[0]
+            else:
+                rows = ctx.rows[np.arange(y0, y1) if rows is None else rows]
+                y0, y1 = (int(rows[0]), int(rows[-1]) + 1) if len(rows) else (y0, y0)
+            ctx = ctx.parent
+        return ctx, y0, y1, x0, x1, rows
+    
+    def grayscale(self):  # -> np.ndarray
+        if self.img.ndim == 2: return self.img
+        if self.parent is not None: return self.cached("grayscale", lambda: self.from_parent(self.parent.grayscale()))
+        return self.cached("grayscale", lambda: to_grayscale(self.img))
+    
+    def inverted(self):  # -> np.ndarray
+        """The grayscale image, inverted (255 - grayscale)
+        """
+        if self.parent is not None: return self.cached("inverted", lambda: self.from_parent(self.parent.inverted()))
+        return self.cached("inverted", lambda: 255 - self.grayscale())
+    
+    def row_profile(self, full=False, value=200, bigger_than=True, inverted=False):  # -> np.ndarray
+        """row_profile() of the grayscale (or inverted) image
+        """
+        key = ("row_profile", full, value, bigger_than, inverted)
+        return self.cached(key, lambda: row_profile(self.inverted() if inverted else self.grayscale(), full, value, bigger_than))
+    
+    def column_profile(self, full=False, value=200, bigger_than=True, inverted=False):  # -> np.ndarray
+        """row_profile() of the transposed grayscale (or inverted) image, one value per column
+        """
+        key = ("column_profile", full, value, bigger_than, inverted)
+        return self.cached(key, lambda: row_profile((self.inverted() if inverted else self.grayscale()).T, full, value, bigger_than))
+    
+    def theme(self):  # -> Theme
+        return self.cached("theme", lambda: Theme(self.img))
+
+# file endings of the exported models, next to the weights (see export_model())
+export_suffixes = {"torchscript": ".ts", "onnx": ".onnx"}
+
+def export_path(weights: str, runtime: Literal["torchscript", "onnx"]):  # -> str
+    return os.path.splitext(weights)[0] + export_suffixes[runtime]
+
+def export_model(arch, weights: str, args=(), img_size=224, cc=3, runtimes=("torchscript", "onnx"), opset=17):  # -> list
+    """Exports a model to frozen TorchScript and / or ONNX, next to its weights (e.g. models/general_1.ts & models/general_1.onnx).
+    The exports are traced with a cc x img_size x img_size input, the batch dimension stays dynamic.
+    
+    Args:
+        arch, weights, args: see ModelRegistry.get()
+        img_size, cc: model input size & channels
+        runtimes: the formats to export
+        opset: ONNX opset version
+    
+    Returns:
+        The paths of the exported files
+    """
+    model = arch(*args)
+    model.load_state_dict(torch.load(weights, map_location="cpu"))
+    model.eval()
+    example = torch.zeros(1, cc, img_size, img_size)
+    paths = []
+    with torch.no_grad():
+        if "torchscript" in runtimes:
+            path = export_path(weights, "torchscript")
+            torch.jit.save(torch.jit.freeze(torch.jit.trace(model, example)), path)
+            paths.append(path)
+        if "onnx" in runtimes:
+            path = export_path(weights, "onnx")
+            torch.onnx.export(model, example, path, input_names=["input"], output_names=["output"],
+                              dynamic_axes={"input": {0: "batch"}, "output": {0: "batch"}}, opset_version=opset)
+            paths.append(path)
+    return paths
+
+def quantized_path(weights: str):  # -> str
+    return os.path.splitext(weights)[0] + ".int8.ts"
+
+def quantize_model(model, calibration=None):  # -> nn.Module
+    """Int8 version of a model for CPU inference: linear layers are quantized dynamically (int8 weights, activations quantized
+    on the fly), convolutions statically with the activation ranges observed on the calibration batches.
+    Without calibration batches only the linear layers are quantized.
+    
+    Args:
+        model: the float model
+        calibration: list of input tensors (N x C x H x W), preprocessed like the model's inputs (see to_tensor_batch())
+    
+    Returns:
+        The quantized model (on the CPU, in eval mode)
+    """
+    import copy
+    model = copy.deepcopy(model).cpu().eval()
+    if not calibration: return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+    
+    from torch.ao.quantization import QConfigMapping, get_default_qconfig, default_dynamic_qconfig
+    from torch.ao.quantization.quantize_fx import prepare_fx, convert_fx
+    mapping = QConfigMapping().set_object_type(nn.Conv2d, get_default_qconfig(torch.backends.quantized.engine)) \
+                              .set_object_type(nn.Linear, default_dynamic_qconfig)
+    prepared = prepare_fx(model, mapping, (calibration[0],))
+    with torch.no_grad():
+        for batch in calibration: prepared(batch)
+    return convert_fx(prepared)
+
+class OrtModel:
+    """A model exported to ONNX, run by ONNX Runtime on the CPU execution provider. It is called like the nn.Module it was
+    exported from (torch.Tensor in & out). The graph optimizations are done once and cached next to the model (*.opt.onnx).
+    
+    Args:
+        path: path to the .onnx file
+        threads: intra op threads (None lets ONNX Runtime decide)
+    """
+    def __init__(self, path: str, threads=None):
+        import onnxruntime as ort
+        options = ort.SessionOptions()
+        if threads is not None: options.intra_op_num_threads = threads
+        optimized = os.path.splitext(path)[0] + ".opt.onnx"
+        self.path = path
+        if os.path.exists(optimized) and os.path.getmtime(optimized) >= os.path.getmtime(path):
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            path = optimized
+        else:
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            options.optimized_model_filepath = optimized
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input = self.session.get_inputs()[0].name
+    
+    def __call__(self, x):  # -> torch.Tensor
+        arr = x.detach().cpu().numpy() if isinstance(x, torch.Tensor) else x
+        return torch.from_numpy(self.session.run(None, {self.input: np.ascontiguousarray(arr, dtype=np.float32)})[0])
+    
+    def eval(self):  # -> OrtModel
+        return self
+    
+    def size(self):  # -> int
+        return os.path.getsize(self.path)
+
+def model_size(model):  # -> int
+    # size of the weights of a loaded model in bytes
+    if isinstance(model, OrtModel): return model.size()
+    return sum(t.numel() * t.element_size() for t in list(model.parameters()) + list(model.buffers()))
+
+class ModelRegistry:
+    """Process wide cache of loaded models, keyed by (architecture, weights path, device, runtime).
+    Every model is loaded once, kept in eval mode and evicted least recently used first
+    when there are more than max_models models or more than max_bytes of parameters loaded.
+    
+    Args:
+        max_models: maximum number of resident models
+        max_bytes: maximum combined size of the parameters & buffers of the resident models (None for no limit)
+        runtime: "torch" (eager PyTorch), "torchscript" or "onnx" (ONNX Runtime, CPU only). The last two need the exported
+            models (see export_model()), without them (or without onnxruntime) the PyTorch model is used
+        quantize: int8 inference on the CPU for quantizable architectures (ConvNet), takes precedence over runtime.
+            Uses the calibrated model written by calibrate_models.py, without it only the linear layers are quantized
+    """
+    def __init__(self, max_models=8, max_bytes=None, runtime: Literal["torch", "torchscript", "onnx"] = "torch", quantize=False):
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self.runtime = runtime
+        self.quantize = quantize
+        self.models = OrderedDict()
+        self.sizes = {}
+        self.load_counts = {}
+        self.load_times = {}
+    
+    def key(self, arch, weights: str, device, args=()):  # -> tuple
+        return (arch.__name__, tuple(args), weights, str(device), self.runtime, self.quantize)
+    
+    def load(self, arch, weights: str, device, args=()):  # -> nn.Module | torch.jit.ScriptModule | OrtModel
+        # quantized kernels only run on the CPU
+        if self.quantize and str(device) == "cpu" and getattr(arch, "quantizable", False):
+            if os.path.exists(quantized_path(weights)): return torch.jit.load(quantized_path(weights), map_location="cpu").eval()
+            print(f"Pluto WARNING - No calibrated int8 model for {weights} (see calibrate_models.py), only its linear layers are quantized.")
+            model = arch(*args)
+            model.load_state_dict(torch.load(weights, map_location="cpu"))
+            return quantize_model(model)
+        runtime = self.runtime
+        # ONNX Runtime only runs on the CPU execution provider here, GPUs use TorchScript
+        if runtime == "onnx" and str(device) != "cpu": runtime = "torchscript"
+        if runtime != "torch" and not os.path.exists(export_path(weights, runtime)):
+            print(f"Pluto WARNING - No {runtime} export of {weights} found (see export_models.py), using the PyTorch model.")
+            runtime = "torch"
+        if runtime == "onnx":
+            try: return OrtModel(export_path(weights, "onnx"))
+            except ImportError:
+                print("Pluto WARNING - onnxruntime is not installed, using the PyTorch model.")
+                runtime = "torch"
+        if runtime == "torchscript": return torch.jit.load(export_path(weights, "torchscript"), map_location=device).eval()
+        model = arch(*args)
+        model.load_state_dict(torch.load(weights, map_location=device))
+        return model.to(device).eval()
+    
+    def get(self, arch, weights: str, device, args=()):  # -> nn.Module
+        """Returns the model, loading it only if it isn't resident
+        
+        Args:
+            arch: the model class, e.g. ConvNet
+            weights: path to the state dict
+            device: "cuda" or "cpu"
+            args: positional arguments for the model class
+        
+        Returns:
+            The model with loaded state, in eval mode on the device (or its TorchScript / ONNX Runtime export, see runtime)
+        """
+        key = self.key(arch, weights, device, args)
+        if key in self.models:
+            self.models.move_to_end(key)
+            return self.models[key]
+        
+        start = time.perf_counter()
+        model = self.load(arch, weights, device, args)
+        
+        self.load_counts[key] = self.load_counts.get(key, 0) + 1
+        self.load_times[key] = self.load_times.get(key, 0.0) + time.perf_counter() - start
+        self.sizes[key] = model_size(model)
+        self.models[key] = model
+        self.evict()
+        return model
+    
+    def evict(self):
+        """Drops least recently used models until the limits are met again (the most recent model always stays)
+        """
+        while len(self.models) > 1 and (len(self.models) > self.max_models or (self.max_bytes is not None and self.memory() > self.max_bytes)):
+            key, _ = self.models.popitem(last=False)
+            del self.sizes[key]
+    
+    def release(self, key=None):
+        """Drops one model (or all of them if key is None)
+        """
+        keys = list(self.models) if key is None else [key]
+        for k in keys:
+            self.models.pop(k, None)
+            self.sizes.pop(k, None)
+        if torch.cuda.is_available(): torch.cuda.empty_cache()
+    
+    def memory(self):  # -> int
+        """Combined size of the resident models in bytes
+        """
+        return sum(self.sizes.values())
+    
+    def stats(self):  # -> dict
+        """Load counts & accumulated load times (seconds) per model key, and whether the model is resident
+        """
+        return {key: {"loads": self.load_counts[key], "load_time": self.load_times[key], "resident": key in self.models} for key in self.load_counts}
+
+models = ModelRegistry()
+
+class InputBuffer:
+    """Preallocated float32 N x C x H x W buffers the model inputs are written into. Crops are resized as uint8 and
+    converted to float32 straight into their slot of the batch, so no float64 or stacked temporaries are created.
+    Buffers only grow and are kept per thread, the returned array is overwritten by the next fill() of the same thread.
+    """
+    def __init__(self):
+        import threading
+        self.local = threading.local()
+    
+    def get(self, n, cc, img_size):  # -> np.ndarray
+        """An N x cc x img_size x img_size view into the buffer of that input shape
+        """
+        buffers = self.local.__dict__.setdefault("buffers", {})
+        buf = buffers.get((cc, img_size))
+        if buf is None or len(buf) < n: buf = buffers[(cc, img_size)] = np.empty((max(n, 1), cc, img_size, img_size), dtype=np.float32)
+        return buf[:n]
+    
+    def fill(self, arrs, img_size, cc=3, layout: Literal["reshape", "chw"] = "reshape"):  # -> np.ndarray
+        """Resizes & normalizes (/ 255) the images into the buffer
+        
+        Args:
+            arrs: list of uint8 images (H x W for cc=1, H x W x cc otherwise)
+            img_size: model input size (quadratic)
+            cc: model input channels
+            layout: "chw" transposes the channels in front (H x W x C -> C x H x W). "reshape" reinterprets the
+                H x W x C data as C x H x W, which is what the shipped models were trained with (see PlutoObject.input_layout)
+        
+        Returns:
+            The filled N x cc x img_size x img_size float32 view
+        """
+        out = self.get(len(arrs), cc, img_size)
+        scale = np.float32(255)
+        for i, arr in enumerate(arrs):
+            small = cv2.resize(arr, (img_size, img_size))
+            if small.size != cc * img_size * img_size: raise ValueError(f"Pluto ERROR - Image with {small.shape[2] if small.ndim == 3 else 1} channels for a model with {cc} input channels")
+            if layout == "chw" and small.ndim == 3: src, dst = small.transpose(2, 0, 1), out[i]
+            else: src, dst = small, out[i].reshape(small.shape)
+            np.divide(src, scale, out=dst, dtype=np.float32)
+        return out
+
+input_buffer = InputBuffer()
+
+def to_model_input(arrs, img_size, cc=3, layout: Literal["reshape", "chw"] = "reshape"):  # -> np.ndarray
+    """Resizes & normalizes a list of images into one float32 array of shape N x cc x img_size x img_size (see InputBuffer.fill()).
+    The array is reused by the next call of the same thread.
+    """
+    return input_buffer.fill(arrs, img_size, cc, layout)
+
+class SegmentationEngine:
+    """Runs the UNET segmentation models on batches of images. The models stay resident in the model registry (see models),
+    inference runs in torch.inference_mode and the masks are converted to uint8 on the device, so only uint8 data is copied back.
+    
+    Args:
+        batch_size: images per forward pass
+        channels_last: use the channels last memory format for model & input (faster convolutions on most CPUs)
+        bfloat16: run the model with bfloat16 autocast (only faster on hardware with bf16 support)
+        img_size: input size of the models
+        layout: channel layout of the inputs, see InputBuffer.fill()
+    """
+    def __init__(self, batch_size=8, channels_last=False, bfloat16=False, img_size=256, layout="reshape"):
+        self.batch_size = batch_size
+        self.channels_last = channels_last
+        self.bfloat16 = bfloat16
+        self.img_size = img_size
+        self.layout = layout
+    
+    def model(self, weights: str, device):  # -> nn.Module
+        model = models.get(UNET, weights, device, (3, 1))
+        if self.channels_last and isinstance(model, nn.Module): model.to(memory_format=torch.channels_last)
+        return model
+    
+    def masks(self, weights: str, imgs, device=None):  # -> list
+        """Segments the images with the UNET with the given weights
+        
+        Args:
+            weights: path to the model's state_dict
+            imgs: list of color images as np.ndarray
+            device: "cuda" or "cpu", default is cuda if available
+        
+        Returns:
+            The masks as uint8 np.ndarray of shape img_size x img_size, one per image
+        """
+        if device is None: device = "cuda" if torch.cuda.is_available() else "cpu"
+        model = self.model(weights, device)
+        out = []
+        with torch.inference_mode(), torch.autocast(str(device), dtype=torch.bfloat16, enabled=self.bfloat16):
+            for i in range(0, len(imgs), self.batch_size):
+                tnsr = torch.from_numpy(to_model_input(imgs[i:i + self.batch_size], self.img_size, 3, self.layout)).to(device)
+                if self.channels_last: tnsr = tnsr.contiguous(memory_format=torch.channels_last)
+                # same values as the float path (sigmoid * 255, truncated), but converted before leaving the device
+                mask = torch.sigmoid(model(tnsr).float()).mul_(255).to(torch.uint8)
+                out += list(mask.reshape(-1, self.img_size, self.img_size).cpu().numpy())
+        return out
+
+segmentation = SegmentationEngine()
+
+class TextBlockDetector:
+    """The yolov5-slim text block detector, loaded once from a local copy of the repository, so it runs without network access.
+    The repository is looked up in this order: repo, $PLUTO_YOLO_REPO, the torch.hub cache (filled by any earlier
+    torch.hub.load("patzold/yolov5-slim", ...)). Set allow_download to fetch it from GitHub once if none is found.
+    
+    Args:
+        weights: path to the detector weights
+        repo: directory of a vendored / cloned yolov5-slim (optional)
+        size: inference size of the detector
+        allow_download: download the repository through torch.hub if there is no local copy
+    """
+    github = "patzold/yolov5-slim"
+    
+    def __init__(self, weights="models/text_block.pt", repo=None, size=640, allow_download=False):
+        import threading
+        self.weights = weights
+        self.repo = repo
+        self.size = size
+        self.allow_download = allow_download
+        self.model = None
+        self.lock = threading.Lock()
+    
+    def find_repo(self):  # -> str | None
+        import glob
+        # torch.hub caches checkouts as <owner>_<repo>_<ref>, any ref will do
+        cached = sorted(glob.glob(glob.escape(os.path.join(torch.hub.get_dir(), self.github.replace("/", "_"))) + "_*"))
+        candidates = [self.repo, os.environ.get("PLUTO_YOLO_REPO")] + cached
+        for path in candidates:
+            if path and os.path.exists(os.path.join(path, "hubconf.py")): return path
+        return None
+    
+    def load(self):  # -> torch.nn.Module
+        """Loads the detector (only on the first call)
+        """
+        with self.lock:
+            if self.model is not None: return self.model
+            repo = self.find_repo()
+            if repo is not None: self.model = torch.hub.load(repo, "custom", path=self.weights, source="local", _verbose=False)
+            elif self.allow_download: self.model = torch.hub.load(self.github, "custom", path=self.weights, source="github", _verbose=False)
+            else: raise RuntimeError(f"Pluto ERROR - No local copy of {self.github} found. Clone it and set $PLUTO_YOLO_REPO "
+                                     "(or TextBlockDetector.repo), or set allow_download=True to fetch it once through torch.hub")
+            return self.model
+    
+    def detect(self, imgs):  # -> list
+        """Detects the text blocks of a batch of screenshots in one call
+        
+        Args:
+            imgs: list of screenshots as np.ndarray
+        
+        Returns:
+            One float32 np.ndarray of shape n x 6 (x0, y0, x1, y1, confidence, class) per screenshot
+        """
+        if len(imgs) == 0: return []
+        result = self.load()(list(imgs), size=self.size)
+        return [boxes.cpu().numpy().astype(np.float32) for boxes in result.xyxy]
+    
+    def release(self):
+        with self.lock: self.model = None
+
+text_blocks = TextBlockDetector()
+
+class OcrCache:
+    """Content addressed cache for OCR results. The key is a hash of the crop's bytes, shape & dtype plus the OCR configuration,
+    so the same pixels are only sent to the OCR engine once. Results are kept in an in-memory LRU and, if a path is given, in a SQLite file
+    that survives between runs.
+    
+    Args:
+        max_entries: size of the in-memory LRU
+        path: path to the SQLite file (optional, see open())
+    """
+    def __init__(self, max_entries=4096, path=None):
+        import threading
+        # results are also put from the callbacks of ocr_async() (executor threads), the SQLite connection is shared between threads
+        self.lock = threading.RLock()
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.db = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if path is not None: self.open(path)
+    
+    def open(self, path: str):
+        """Adds the on-disk tier, stored in a SQLite file at path
+        """
+        import sqlite3
+        with self.lock:
+            self.close()
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.execute("CREATE TABLE IF NOT EXISTS ocr (key TEXT PRIMARY KEY, result TEXT)")
+            self.db.commit()
+    
+    def close(self):
+        with self.lock:
+            if self.db is not None: self.db.close()
+            self.db = None
+    
+    def key(self, image: np.ndarray, config):  # -> str
+        """Hash of the crop & the OCR configuration (a tuple of everything that changes the result)
+        """
+        import hashlib
+        h = hashlib.blake2b(np.ascontiguousarray(image).data, digest_size=16)
+        h.update(repr((image.shape, str(image.dtype), config)).encode())
+        return h.hexdigest()
+    
+    def get(self, key: str):  # -> list | None
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            if self.db is not None:
+                row = self.db.execute("SELECT result FROM ocr WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    import json
+                    self.disk_hits += 1
+                    self.remember(key, json.loads(row[0]))
+                    return self.entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, key: str, result: list):
+        with self.lock:
+            self.remember(key, result)
+            if self.db is not None:
+                import json
+                self.db.execute("INSERT OR REPLACE INTO ocr (key, result) VALUES (?, ?)", (key, json.dumps(result)))
+                self.db.commit()
+    
+    def remember(self, key: str, result: list):
+        with self.lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries: self.entries.popitem(last=False)
+    
+    def clear(self):
+        """Empties the in-memory tier & resets the statistics (the SQLite file is kept)
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+    
+    def stats(self):  # -> dict
+        lookups = self.hits + self.disk_hits + self.misses
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses, "entries": len(self.entries),
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0}
+
+ocr_cache = OcrCache()
+
+def _ocr_task(backend, image: np.ndarray, mode: str, x_height, languages, model_dir):  # -> list
+    # runs inside an OcrExecutor worker (thread or process). Errors are raised to the future, so failed reads aren't cached
+    configure_ocr(languages, model_dir)
+    util = PlutoObject(None)
+    util.ocr_x_height = x_height
+    return util.backend(backend).readtext(util.prepare_ocr_input(image), mode, None)
+
+class OcrExecutor:
+    """Runs the OCR of independent crops (e.g. headline, subtitle & date of an article) concurrently, used by ocr_async()
+    if PlutoObject.ocr_concurrent is set. Backends that are thread safe (Tesseract runs in its own processes) use a thread pool,
+    the others (EasyOCR) a process pool, where every worker process loads its own OCR model on first use.
+    The worker processes are spawned, not forked (CUDA can't be used in forked processes), and there are at most max_processes of them,
+    since each one holds a full copy of the model. The pools are created on first use.
+    
+    Args:
+        workers: number of threads, default is the number of CPU cores
+        max_processes: maximum number of worker processes
+    """
+    def __init__(self, workers=None, max_processes=2):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_processes = max_processes
+        self.threads = None
+        self.processes = None
+    
+    def pool(self, backend):  # -> concurrent.futures.Executor
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+        import multiprocessing
+        if get_backend(backend).thread_safe:
+            if self.threads is None: self.threads = ThreadPoolExecutor(self.workers)
+            return self.threads
+        if self.processes is None:
+            self.processes = ProcessPoolExecutor(min(self.workers, self.max_processes), mp_context=multiprocessing.get_context("spawn"))
+        return self.processes
+    
+    def submit(self, backend, image: np.ndarray, mode="detect", x_height=None):  # -> concurrent.futures.Future
+        """Queues one crop, the future's result is the raw list of strings of the backend
+        """
+        return self.pool(backend).submit(_ocr_task, backend, image, mode, x_height, pluto_ocr.ocr_languages, pluto_ocr.ocr_model_dir)
+    
+    def shutdown(self):
+        for pool in (self.threads, self.processes):
+            if pool is not None: pool.shutdown()
+        self.threads = self.processes = None
+
+ocr_executor = OcrExecutor()
+
 class PlutoObject:
+    # OCR backend used by the class, can be changed per class, instance or call (see ocr())
+    ocr_backend = "easyocr"
+    # read the whole screenshot once (with text boxes) and answer the OCR of crops from it, see field_text()
+    single_pass = False
+    # languages of the screenshots the class reads (ISO 639-1 codes), None uses the default OCR languages (see configure_ocr())
+    ocr_languages = None
+    # channel layout of the model inputs, "chw" for models trained on transposed inputs (see InputBuffer.fill())
+    input_layout = "reshape"
+    # ocr_async() runs on ocr_executor, otherwise it reads the crop right away (opt-in, see OcrExecutor)
+    ocr_concurrent = False
+    
     def __init__(self, img: np.ndarray):
         self.img = img
         self.use_easyocr = False
+        self.contexts = {}
+        self.max_contexts = 16
+        self.classify_batch_size = 32  # images per forward pass of classify_batch()
+        self.ocr_batch_size = 32  # crops per OCR call of ocr_many(), larger batches are padded to larger sizes (EasyOCR)
+        self.ocr_mode = "detect"
+        self.ocr_x_height = None  # e.g. 20: crops are rescaled to this x-height before OCR (opt-in), see scale_for_ocr()
+        self.ocr_scale = 1.0  # scale factor of the last OCR input
+    
+    def context(self, img=None):  # -> ScreenshotContext
+        """Returns the ScreenshotContext of an image, creating it on first use.
+        Images cut out with ScreenshotContext.crop_rows() are found as well.
+        
+        Args:
+            img: the image, default is self.img
+        """
+        if img is None: img = self.img
+        ctx = self.contexts.get(id(img))
+        if ctx is None or ctx.img is not img: ctx = self.register_context(ScreenshotContext(img))
+        return ctx
+    
+    def register_context(self, ctx: ScreenshotContext):  # -> ScreenshotContext
+        """Makes a context available to context(), the oldest one is dropped once max_contexts is reached.
+        The contexts only hold weak references, an entry is dropped as soon as its image is garbage collected
+        (so neither are screenshots kept alive by the registry, nor is a reused id() mistaken for an old image).
+        """
+        key = id(ctx.img)
+        if self.contexts.get(key) is ctx: return ctx
+        if len(self.contexts) >= self.max_contexts: del self.contexts[next(iter(self.contexts))]
+        self.contexts[key] = ctx
+        ctx.listeners.append(lambda c: self.contexts.pop(key) if self.contexts.get(key) is c else None)
+        return ctx
+    
+    def crop_rows(self, img, start, end):  # -> np.ndarray
+        """Cuts the rows start:end out of img (as a view) and registers its context,
+        so that derived images of the crop are taken from the ones of img.
+        """
+        crop, ctx = self.context(img).crop_rows(start, end)
+        self.register_context(ctx)
+        return crop
+    
+    def take_rows(self, img, rows):  # -> np.ndarray
+        """Cuts the rows selected by a boolean mask (or index array, rows are taken in ascending order) out of img
+        and registers their context, see crop_rows(). Like Segment.from_mask(), contiguous rows are returned as a view, others are copied once.
+        """
+        mask = np.asarray(rows)
+        if mask.dtype != bool:
+            mask = np.zeros(len(img), dtype=bool)
+            mask[np.asarray(rows, dtype=np.intp)] = True
+        segment = Segment.from_mask(img, mask)
+        if segment.contiguous(): return self.crop_rows(img, int(segment.start), int(segment.end))
+        crop, ctx = self.context(img).take_rows(np.flatnonzero(segment.mask))
+        self.register_context(ctx)
+        return crop
 
     def load_model(self, path, model, device: Literal["cuda", "cpu"]):
         """Loads the state dictionary and applies it to the model
@@ -351,40 +1283,318 @@ class PlutoObject:
             device: If the Tensor should be moved to the GPU, make this "cuda"
         
         Returns:
-            The input array as torch.Tensor
+            The input array as torch.Tensor (a float32 tensor on the CPU shares memory with input_buffer, see to_tensor_batch())
         """
-        arr = cv2.resize(arr.copy(), (img_size, img_size)) / 255.0 # load, resize & normalize
-        # show_image(arr)
-        arr = arr.reshape(-1, cc, img_size, img_size)
-        tensor = torch.from_numpy(arr).to(dtype).to(device) # to tensor
-        return tensor
+        return self.to_tensor_batch([arr], img_size, dtype, device, cc)
+
+    def to_tensor_batch(self, arrs, img_size, dtype, device: Literal["cuda", "cpu"], cc=3):  # --> torch.Tensor
+        """Converts a list of images to one PyTorch Tensor of shape N x cc x img_size x img_size, resized & normalized
+        in the preallocated input_buffer (see InputBuffer). A float32 tensor on the CPU shares the buffer's memory,
+        so it is only valid until the next conversion of the same thread (.clone() it to keep it).
+        """
+        return torch.from_numpy(to_model_input(arrs, img_size, cc, self.input_layout)).to(device, dtype)
+
+    def classify_batch(self, net, imgs, img_size=224, cc=3, batch_size=None, device=None):  # -> np.ndarray
+        """Classifies a list of images with batched forward passes
+        
+        Args:
+            net: the classification model (in eval mode)
+            imgs: list of images as np.ndarray
+            img_size, cc: model input size & channels, see to_tensor()
+            batch_size: images per forward pass, default is self.classify_batch_size
+        
+        Returns:
+            The predicted class per image as np.ndarray
+        """
+        if device is None: device = self.determine_device()
+        if batch_size is None: batch_size = self.classify_batch_size
+        out = []
+        with torch.no_grad():
+            for i in range(0, len(imgs), batch_size):
+                tnsr = self.to_tensor_batch(imgs[i:i + batch_size], img_size, torch.float32, device, cc)
+                out.append(torch.argmax(net(tnsr), dim=1).cpu().numpy())
+        if len(out) == 0: return np.zeros(0, dtype=np.int64)
+        return np.concatenate(out)
 
     def from_tensor(self, tensor, img_size, dtype=np.uint8):
         return tensor.cpu().numpy().reshape(img_size, img_size).astype(dtype)
 
-    def ocr(self, image=None, switch_to_tesseract=False):  # -> str
-        """Preforms OCR on a given image, using EasyOCR
+    def ocr(self, image=None, switch_to_tesseract=False, cache=True, mode=None, backend=None):  # -> str
+        """Preforms OCR on a given image, using the OCR backend of the class (EasyOCR by default)
         
         Args:
             image: np.ndarray of the to be treated image.
-            switch_to_tesseract: deprecated parameter. can be assigned any value with no impact.
+            switch_to_tesseract: deprecated parameter. can be assigned any value with no impact, use backend="tesseract" instead.
+            cache: look the crop up in (and add it to) ocr_cache
+            mode: "detect" (text detection + recognition), "recognize" (recognition only, for crops of a single text line)
+                or "auto" ("recognize" if the crop is a single text line, see is_text_line()). Default is self.ocr_mode
+            backend: name of an OCR backend ("easyocr", "tesseract") or an OcrBackend instance, default is self.ocr_backend
         
         Returns:
             String with the raw result of the OCR library.
         
         """
         if image is None: image = self.img
-        try:
-            # reader = easyocr.Reader(['en'])
-            ocr_raw_result = reader.readtext(image, detail=0)
-        except Exception as e:
-            print("Pluto WARNING - Error while performing OCR: ", e)
-            ocr_raw_result = [""]
+        backend = self.backend(backend)
+        lines = self.field_text(image, backend) if self.single_pass else None
+        if lines is not None: return "".join(" " + line for line in lines)
+        mode = self.resolve_ocr_mode(image, mode, backend)
+        cache = cache and isinstance(image, np.ndarray)
+        key = ocr_cache.key(image, self.ocr_config(mode, backend)) if cache else None
+        ocr_raw_result = ocr_cache.get(key) if cache else None
+        if ocr_raw_result is None: ocr_raw_result = self.readtext(image, key, mode, backend)
         out = ""
         for word in ocr_raw_result:
             out += " " + word
         return out
 
+    def backend(self, backend=None):  # -> OcrBackend
+        """The OCR backend for a call: the one passed, otherwise the one of the class / instance (self.ocr_backend).
+        Backends given by name are switched to self.ocr_languages, instances are used as they are.
+        """
+        if backend is None: backend = self.ocr_backend
+        if not isinstance(backend, str) or self.ocr_languages is None: return get_backend(backend)
+        backend = get_backend(backend)
+        return backend.with_languages(self.ocr_languages) if hasattr(backend, "with_languages") else backend
+
+    def ocr_config(self, mode="detect", backend=None, output="text"):  # -> tuple
+        """Everything that changes the OCR result, part of the ocr_cache key
+        
+        Args:
+            mode, backend: see ocr()
+            output: "text" for the list of strings of readtext(), "boxes" for the text boxes of readtext_boxes()
+        """
+        return self.backend(backend).config() + (output, mode, self.ocr_x_height)
+
+    def prepare_ocr_input(self, image: np.ndarray):  # -> np.ndarray
+        """Rescales a crop to self.ocr_x_height (see scale_for_ocr()), the factor is stored in self.ocr_scale
+        """
+        self.ocr_scale = 1.0
+        if self.ocr_x_height is None or not isinstance(image, np.ndarray) or image.size == 0: return image
+        image, self.ocr_scale = scale_for_ocr(image, self.ocr_x_height)
+        return image
+
+    def is_text_line(self, image: np.ndarray):  # -> bool
+        """True if the crop holds exactly one line of text (and is wider than high), so the text detector can be skipped
+        """
+        if not isinstance(image, np.ndarray) or image.size == 0 or image.shape[1] < image.shape[0]: return False
+        return text_line_count(image) == 1
+
+    def resolve_ocr_mode(self, image, mode=None, backend=None):  # -> Literal["detect", "recognize"]
+        if mode is None: mode = self.ocr_mode
+        if not self.backend(backend).recognize_only: return "detect"
+        if mode == "auto": return "recognize" if self.is_text_line(image) else "detect"
+        return mode
+
+    def readtext(self, image: np.ndarray, key=None, mode="detect", backend=None, allowlist=None):  # -> list
+        """Runs the OCR backend on a single image, the result is added to ocr_cache if a key is given.
+        In "recognize" mode the whole image is read as one text line, without running the text detector.
+        """
+        try:
+            result = self.backend(backend).readtext(self.prepare_ocr_input(image), mode, allowlist)
+        except Exception as e:
+            print("Pluto WARNING - Error while performing OCR: ", e)
+            return [""]
+        if key is not None: ocr_cache.put(key, result)
+        return result
+
+    def ocr_async(self, image=None, cache=True, mode=None, backend=None):  # -> concurrent.futures.Future
+        """ocr() on ocr_executor, so several independent crops are read concurrently. Cached results are returned right away.
+        Unless ocr_concurrent is set, the crop is read before returning and the future is already done.
+        
+        Args:
+            see ocr()
+        
+        Returns:
+            A future, its result is the same string ocr() would return
+        """
+        from concurrent.futures import Future
+        if image is None: image = self.img
+        backend = self.backend(backend)
+        out = Future()
+        if not self.ocr_concurrent:
+            out.set_result(self.ocr(image, cache=cache, mode=mode, backend=backend))
+            return out
+        lines = self.field_text(image, backend) if self.single_pass else None
+        if lines is not None:
+            out.set_result("".join(" " + line for line in lines))
+            return out
+        mode = self.resolve_ocr_mode(image, mode, backend)
+        key = ocr_cache.key(image, self.ocr_config(mode, backend)) if cache and isinstance(image, np.ndarray) else None
+        cached = ocr_cache.get(key) if key is not None else None
+        if cached is not None:
+            out.set_result("".join(" " + word for word in cached))
+            return out
+        
+        def done(future):
+            try: result = future.result()
+            except Exception as e:
+                print("Pluto WARNING - Error while performing OCR: ", e)
+                result = [""]
+            else:
+                if key is not None: ocr_cache.put(key, result)
+            out.set_result("".join(" " + word for word in result))
+        
+        # backends are sent to worker processes by name, instances only if they aren't registered
+        name = backend.name if pluto_ocr.is_shared(backend) else backend
+        ocr_executor.submit(name, image, mode, self.ocr_x_height).add_done_callback(done)
+        return out
+
+    def probe(self, image: np.ndarray, token: str, start=True, backend=None):  # -> bool
+        """Cheap yes / no check whether a crop starts with (or contains) a token, for decisions that don't need the full text.
+        For start=True only the left part of the crop that can hold the token is read, line shaped crops skip the text detector
+        and the recognizer is limited to the characters of the token, letters & digits.
+        
+        Args:
+            image: the crop
+            token: the text to look for, e.g. "@" or "By "
+            start: True to check if the crop starts with token, False to check if it contains it anywhere
+            backend: see ocr()
+        
+        Returns:
+            True if the token was found
+        """
+        if not isinstance(image, np.ndarray) or image.size == 0: return False
+        backend = self.backend(backend)
+        # the whole crop: text boxes are assigned by their center, which usually lies outside the prefix read below
+        lines = self.field_text(image, backend) if self.single_pass else None
+        if lines is not None:
+            text = " ".join(lines).strip()
+            return text.startswith(token.strip()) if start else token.strip() in text
+        # characters are at most ~0.8x as wide as the line is high, with a bit of margin for the left padding
+        if start: image = image[:, :int(image.shape[0] * 0.8 * (len(token) + 3))]
+        allowlist = "".join(sorted(set(token + string.ascii_letters + string.digits)))
+        mode = self.resolve_ocr_mode(image, "auto", backend)
+        key = ocr_cache.key(image, self.ocr_config(mode, backend) + ("probe", allowlist))
+        result = ocr_cache.get(key)
+        if result is None: result = self.readtext(image, key, mode, backend, allowlist)
+        text = " ".join(result).strip()
+        return text.startswith(token.strip()) if start else token.strip() in text
+
+    def ocr_many(self, crops, batch_size=None, cache=True, mode=None, backend=None):  # -> list
+        """Preforms OCR on a list of crops with batched OCR calls (if the backend supports batching), results are returned in the order of the crops.
+        If the backend needs images of the same size per batch (same_size_batches, EasyOCR), crops are sorted by size and padded
+        (with their background color, see background_color()) to the largest crop of their batch. As the padding can change the result,
+        those results are cached under the key of the padded crop, not under the one ocr() uses.
+        
+        Args:
+            crops: list of np.ndarray
+            batch_size: crops per OCR call, default is self.ocr_batch_size
+            cache: look the crops up in (and add them to) ocr_cache
+            mode: see ocr(), crops in "recognize" mode skip the detector and are read one by one
+            backend: see ocr()
+        
+        Returns:
+            List of strings, one per crop, in the same format as ocr(). The scale factor of each crop is stored in self.ocr_scales
+        """
+        if batch_size is None: batch_size = self.ocr_batch_size
+        backend = self.backend(backend)
+        modes = [self.resolve_ocr_mode(c, mode, backend) for c in crops]
+        keys = [ocr_cache.key(c, self.ocr_config(m, backend)) if cache and isinstance(c, np.ndarray) else None for c, m in zip(crops, modes)]
+        results = [self.field_text(c, backend) if self.single_pass else None for c in crops]
+        results = [r if r is not None or k is None else ocr_cache.get(k) for r, k in zip(results, keys)]
+        
+        # empty crops, non-arrays & text lines are left to the single crop path
+        todo = [i for i in range(len(crops)) if results[i] is None and modes[i] == "detect" and isinstance(crops[i], np.ndarray) and crops[i].size > 0]
+        if not backend.batching: todo = []
+        scaled, self.ocr_scales = {}, [1.0] * len(crops)
+        for i in todo:
+            scaled[i] = self.prepare_ocr_input(crops[i])
+            self.ocr_scales[i] = self.ocr_scale
+        todo = sorted(todo, key=lambda i: scaled[i].shape[:2])
+        for b in range(0, len(todo), batch_size):
+            batch = todo[b:b + batch_size]
+            if len(batch) == 1: continue  # single crops are read without padding below
+            images, batch_keys = [scaled[i] for i in batch], [keys[i] for i in batch]
+            if backend.same_size_batches:
+                h = max(scaled[i].shape[0] for i in batch)
+                w = max(scaled[i].shape[1] for i in batch)
+                batch_keys = [k + f"/padded {h}x{w}" if k is not None else None for k in batch_keys]
+                cached = [ocr_cache.get(k) if k is not None else None for k in batch_keys]
+                if all(r is not None for r in cached):
+                    for i, r in zip(batch, cached): results[i] = r
+                    continue
+                images = [cv2.copyMakeBorder(img, 0, h - img.shape[0], 0, w - img.shape[1], cv2.BORDER_CONSTANT, value=background_color(img)) for img in images]
+            try:
+                batch_result = backend.readtext_batched(images, batch_size)
+            except Exception as e:
+                print("Pluto WARNING - Error while performing batched OCR, falling back to single crops: ", e)
+                continue
+            for i, k, r in zip(batch, batch_keys, batch_result):
+                results[i] = r
+                if k is not None: ocr_cache.put(k, r)
+        
+        out = []
+        for i in range(len(crops)):
+            if results[i] is None:
+                results[i] = self.readtext(crops[i], keys[i], modes[i], backend)
+                self.ocr_scales[i] = self.ocr_scale
+            out.append("".join(" " + word for word in results[i]))
+        return out
+
+    def ocr_boxes(self, img=None, backend=None):  # -> TextBoxes | None
+        """Reads the whole screenshot once with text boxes, the result is cached in its context (and in ocr_cache).
+        
+        Args:
+            img: the screenshot (or its ScreenshotContext), default is self.img
+            backend: see ocr(), must support boxes
+        
+        Returns:
+            TextBoxes in screenshot coordinates, None if the backend has no boxes or OCR failed
+        """
+        ctx = img if isinstance(img, ScreenshotContext) else self.context(img)
+        backend = self.backend(backend)
+        if not backend.boxes: return None
+        config = self.ocr_config("detect", backend, "boxes")
+        if ("ocr_boxes",) + config in ctx.cache: return ctx.cache[("ocr_boxes",) + config]
+        # the context only references its screenshot weakly
+        img = ctx.img
+        if img is None: return None
+        key = ocr_cache.key(img, config)
+        items = ocr_cache.get(key)
+        if items is None:
+            try:
+                result = backend.readtext_boxes(self.prepare_ocr_input(img))
+            except Exception as e:
+                print("Pluto WARNING - Error while performing OCR: ", e)
+                return None
+            items = []
+            for box, text, conf in result:
+                box = np.array(box, dtype=np.float32) / self.ocr_scale
+                items.append([int(box[:, 0].min()), int(box[:, 1].min()), int(np.ceil(box[:, 0].max())), int(np.ceil(box[:, 1].max())), text, float(conf)])
+            ocr_cache.put(key, items)
+        return ctx.cached(("ocr_boxes",) + config, lambda: TextBoxes(items))
+
+    def locate(self, crop: np.ndarray):  # -> tuple | None
+        """Finds where a crop lies in the screenshot it was cut out of, if it is a view into one of the registered contexts
+        (their image, grayscale or inverted image) or into one of their parents.
+        
+        Returns:
+            (context of the screenshot, y0, y1, x0, x1, rows) or None, see ScreenshotContext.to_root()
+        """
+        self.context()
+        for ctx in list(self.contexts.values()):
+            for base in (ctx.img, ctx.cache.get("grayscale"), ctx.cache.get("inverted")):
+                area = locate_view(crop, base) if base is not None else None
+                if area is not None: return ctx.to_root(*area)
+        return None
+
+    def field_text(self, crop: np.ndarray, backend=None):  # -> list | None
+        """The text lines of a crop, taken from the single OCR pass over its screenshot (see ocr_boxes()) instead of reading the crop.
+        Lines are assigned to the crop by the center of their box.
+        
+        Returns:
+            List of strings, None if the crop can't be located (e.g. it was copied) or the backend has no boxes
+        """
+        backend = self.backend(backend)
+        if not backend.boxes or not isinstance(crop, np.ndarray) or crop.size == 0: return None
+        found = self.locate(crop)
+        if found is None: return None
+        ctx, y0, y1, x0, x1, rows = found
+        boxes = self.ocr_boxes(ctx, backend)
+        if boxes is None: return None
+        return boxes.text_in(y0, y1, x0, x1, rows)
+
     def expand_to_rows(self, image: np.ndarray, full=False, value=200):  # -> np.ndarray
         """
         Args:
@@ -393,17 +1603,7 @@ class PlutoObject:
         Returns:
             A np.ndarray of the edited image.
         """
-        dimensions = image.shape
-        imglen = dimensions[0]
-        if not full: imglen = dimensions[0] / 2
-        for i in range(int(imglen)):
-            for j in range(dimensions[1]):
-                if image[i][j] > value:
-                    image[i] = [255 for k in range(dimensions[1])]
-        for i in range(int(imglen), dimensions[0]):
-            for j in range(dimensions[1]):
-                image[i][j] = 0
-        return image
+        return expand_to_rows(image, full, value)
 
     def ocr_cleanup(self, text: str):  # -> str
         """Removes unwanted characters or symbols from a text
@@ -416,33 +1616,12 @@ class PlutoObject:
         Returns:
             The cleaned text as String.
         """
-        out = text.replace("\n", " ")
-        out = out.replace("\x0c", "")
-        out = " ".join(out.split())
-        
-        splits = out.split(",")
-        clean_splits = []
-        
-        for phrase in splits:
-            arr = list(phrase)
-            l = len(arr)
-            start = 0
-            end = l
-            for i in range(0, l):
-                if arr[i] == " ": start += 1
-                else: break
-            for i in range(l, 0, -1):
-                if arr[i-1] == " ": end -= 1
-                else: break
-            clean_splits.append(phrase[start:end])
-        
-        out = ""
-        for phrase in clean_splits:
-            out += phrase
-            out += ", "
-        out = out[:-2]
-        
-        return out
+        return clean_text(text)
+
+    def ocr_cleanup_many(self, texts):  # -> list
+        """ocr_cleanup() for a list of OCR results (e.g. the return of ocr_many())
+        """
+        return clean_texts(texts)
 
     def to_json(self, data: dict):
         import json
@@ -465,6 +1644,12 @@ class PlutoObject:
     def determine_device(self): # -> Literal["cuda", "cpu"]
         return "cuda" if torch.cuda.is_available() else "cpu"
 
+    def get_model(self, arch, weights: str, args=(), device=None):  # -> nn.Module
+        """Returns a model from the process wide registry (see ModelRegistry.get()), loading it on first use
+        """
+        if device is None: device = self.determine_device()
+        return models.get(arch, weights, device, args)
+
     def run_model(self, model, tnsr):
         """Runs a model with a sigmoid activation function
         """
@@ -479,23 +1664,19 @@ class PlutoObject:
             state_path: path to the models's state_dict
             img: the model's input image
         
-        Returns:
-            The model's prediction as np.ndarray
-        """
-        if img is None: img = self.img
-        
-        device = self.determine_device()
-        
-        model = UNET(in_channels=3, out_channels=1)
-        model = self.load_model(model, state_path, device)
-        
-        input_tensor = self.to_tensor(img, 256, torch.float32, device)
-        
-        prediction = self.run_model(model, input_tensor)
-        
-        output = self.from_tensor(prediction, 256)
+        Returns:
+            The model's prediction as np.ndarray
+        """
+        if img is None: img = self.img
+        return self.run_segmentation_batch(state_path, [img])[0]
+
+    def run_segmentation_batch(self, state_path, imgs):  # -> list
+        """run_segmentation_model() for a list of images, with batched forward passes (see SegmentationEngine)
         
-        return output
+        Returns:
+            The model's predictions as uint8 np.ndarray, one per image
+        """
+        return segmentation.masks(state_path, imgs, self.determine_device())
 
     def extr_mask_img(self, mask: np.ndarray, img: np.ndarray, inverted=False):
         """Performs extend_to_rows() on the mask and returns the masked out parts of the original image.
@@ -510,18 +1691,12 @@ class PlutoObject:
         """
         mask = cv2.resize(mask, (img.shape[1], img.shape[0]))
         
-        extr = self.expand_to_rows(mask)
+        extr = row_profile(mask) > 200
         
-        # show_image(extr)
+        out = Segment.from_mask(img, extr).image()
         
-        out = []
-        invout = []
-        for i in range(len(extr)):
-            if extr[i][0] > 200: out.append(img[i])
-            elif inverted: invout.append(img[i])
-        
-        if inverted: return np.array(out), np.array(invout)
-        return np.array(out)
+        if inverted: return out, Segment.from_mask(img, ~extr).image()
+        return out
 
     def extr_replace_mask(self, mask: np.ndarray, img: np.ndarray, replace_value: np.ndarray, invert_replace=False):
         """Performs extend_to_rows() on the mask and returns the masked out parts of the original image.
@@ -536,37 +1711,20 @@ class PlutoObject:
         """
         mask = cv2.resize(mask, (img.shape[1], img.shape[0]))
         
-        extr = self.expand_to_rows(mask)
+        extr = row_profile(mask)
         
-        if invert_replace:
-            for i in range(len(extr)):
-                if extr[i][0] > 200:
-                    for j in range(len(img[i])):
-                        img[i][j] = replace_value
-        else:
-            for i in range(len(extr)):
-                if extr[i][0] < 200:
-                    for j in range(len(img[i])):
-                        img[i][j] = replace_value
+        if invert_replace: img[extr > 200] = replace_value
+        else: img[extr < 200] = replace_value
         
         return img
 
     def characters_filter_strict(self, inpt: str, allow_digits=True): # -> str
-        numbers =  list(range(128))
         # only digits, uppercase, lowercase and spaces letters are valid
-        allowed_ascii_values = numbers[65:91] + numbers[97:123] + [32]
-        if allow_digits: allowed_ascii_values += numbers[48:58]
-        
-        out = ""
-        
-        for i in inpt:
-            if ord(i) in allowed_ascii_values: out += i
-        
-        out = " ".join(out.split())
-
-        return out
+        return filter_strict(inpt, allow_digits)
 
 class FoxNews(PlutoObject):
+    byline_skip = frozenset(("News", "Fox", "|"))
+    
     def __init__(self, img: np.ndarray):
         super().__init__(img)
     
@@ -581,42 +1739,18 @@ class FoxNews(PlutoObject):
         """
         og_shape = self.img.shape
         img = cv2.resize(self.img, (512, 512))
-        black = np.zeros((512, 512))
-
-        for i in range(len(black)):
-            for j in range(len(black[0])):
-                temp = img[i][j]
-                if (temp == [34, 34, 34]).all(): black[i][j] = 255
+        black = (img == [34, 34, 34]).all(axis=2) * 255.0
         blured = cv2.blur(black, (20, 20))
+        blured = np.where(blured < 40, 0.0, 255.0)
 
-        for i in range(len(blured)):
-            for j in range(len(blured[0])):
-                if blured[i][j] < 40: blured[i][j] = 0
-                else: blured[i][j] = 255
+        msk = row_profile(blured)
 
-        msk = self.expand_to_rows(blured)
-
-        og_size_msk = cv2.resize(msk, (og_shape[1], og_shape[0]))
+        og_size_msk = resize_profile(msk, og_shape[0]) > 1
+        first_heading = np.argmax(og_size_msk) if og_size_msk.any() else len(og_size_msk)
         
-        top = []
-        heading = []
-        bottom = []
-
-        top_part = True
-        bottom_part = False
-
-        for i in range(len(self.img)):
-            if og_size_msk[i][0] > 1:
-                heading.append(self.img[i])
-                if top_part:
-                    top_part = False
-                    bottom_part = True
-            elif top_part: top.append(self.img[i])
-            else: bottom.append(self.img[i])
-
-        heading = np.array(heading)
-        bottom = np.array(bottom)
-        top = np.array(top)
+        heading = Segment.from_mask(self.img, og_size_msk).image()
+        top = self.img[:first_heading]
+        bottom = Segment.from_mask(self.img[first_heading:], ~og_size_msk[first_heading:]).image()
         
         if display:
             show_image(heading)
@@ -626,52 +1760,31 @@ class FoxNews(PlutoObject):
         ocr_result = self.ocr(heading)
         headline = self.ocr_cleanup(ocr_result)
 
-        cat_info_img = []
-        top_len = len(top)
-        for i in range(top_len, 0, -1):
-            if top[i-1][0][0] > 250: cat_info_img.insert(0, top[i-1])
-            else: break
-
-        cat_info_img = np.array(cat_info_img)
+        # bright rows at the very end of the top part
+        not_bright = np.flatnonzero(top[:, 0, 0] <= 250)
+        cat_info_img = top[not_bright[-1] + 1:] if len(not_bright) else top
         if display: show_image(cat_info_img)
 
         ocr_result = self.ocr(cat_info_img)
         clean_ocr = self.ocr_cleanup(ocr_result)
 
-        dotsplit = clean_ocr.split("-")[0][:-1].lstrip(" ")
+        dotsplit = clean_ocr.partition("-")[0][:-1].lstrip(" ")
         pubsplit = clean_ocr.split("Published")[1].lstrip(" ")
         
-        subinfo_bottom = []
-
-        stoper = False
-        for row in bottom:
-            subinfo_bottom.append(row)
-            for pix in row:
-                if pix[0] > 200 and pix[0] < 240 and pix[2] < 50 and pix[1] < 50:
-                    stoper = True
-                    break
-            if stoper: break
+        # everything up to (and including) the first row with a red pixel
+        red = ((bottom[:, :, 0] > 200) & (bottom[:, :, 0] < 240) & (bottom[:, :, 2] < 50) & (bottom[:, :, 1] < 50)).any(axis=1)
+        stop = np.argmax(red) + 1 if red.any() else len(bottom)
 
-        subinfo_bottom = np.array(subinfo_bottom[:-3])
+        subinfo_bottom = bottom[:stop][:-3]
         if display: show_image(subinfo_bottom)
         subinfo = self.ocr_cleanup(self.ocr(subinfo_bottom))
 
+        # the author follows the last "By", the subtitle is everything before it
         subsplit = subinfo.split()
+        by = len(subsplit) - 1 - subsplit[::-1].index("By") if "By" in subsplit else -1
 
-        author_list = []
-        subtitle_list = []
-        subinfo_switcher = True
-
-        for w in reversed(subsplit):
-            if w == "By" and subinfo_switcher:
-                subinfo_switcher = False
-                continue
-            if w == "News" or w == "Fox" or w == "|": continue
-            if subinfo_switcher: author_list.insert(0, w)
-            else: subtitle_list.insert(0, w)
-
-        author = " ".join(author_list)
-        subtitle = " ".join(subtitle_list)
+        author = " ".join(w for w in subsplit[by + 1:] if w not in self.byline_skip)
+        subtitle = " ".join(w for w in subsplit[:max(by, 0)] if w not in self.byline_skip)
         
         return pubsplit, headline, subtitle, author, dotsplit
     
@@ -698,6 +1811,9 @@ class FoxNews(PlutoObject):
             out.close()
 
 class Facebook(PlutoObject):
+    # shares & views of the engagement line, e.g. "12 Comments 3 Shares 1.2K Views"
+    engagement_pattern = re.compile(r"^(?:(?!Comments).)*Comments((?:(?!Comments).)*?)Shares(.*?)(?=Views|Shares|Comments|\Z)", re.S)
+    
     def __init__(self, img: np.ndarray):
         super().__init__(img)
         self.header = None
@@ -766,12 +1882,10 @@ class Facebook(PlutoObject):
         header = self.header[: int(self.header.shape[0] / 2)]
         
         engocr = None
-        headerocr = self.ocr_cleanup(self.ocr(header))
-        dateocr = self.ocr_cleanup(self.ocr(date))
-        textocr = self.ocr_cleanup(self.ocr(self.text))
-        if self.engagement is not None:
-            engocr = self.ocr_cleanup(self.ocr(self.engagement))
-            engocr = self.engagement_str(engocr)
+        fields = [self.ocr_async(crop) for crop in (header, date, self.text)]
+        if self.engagement is not None: engocr = self.ocr_async(self.engagement)
+        headerocr, dateocr, textocr = self.ocr_cleanup_many([f.result() for f in fields])
+        if engocr is not None: engocr = self.engagement_str(self.ocr_cleanup(engocr.result()))
         
         return headerocr, dateocr, textocr, engocr
     
@@ -780,10 +1894,11 @@ class Facebook(PlutoObject):
         """
         if img is None: img = self.img
         
-        og_img = img.copy()
-        img = to_grayscale(img)
+        og_img = img
+        ctx = self.context(og_img)
+        img = ctx.grayscale()
         dm = self.dark_mode(img)
-        if dm: img = 255 - img
+        if dm: img = ctx.inverted()
         exists1 = False
         for i in range(len(img)):
             if not dm:
@@ -797,8 +1912,7 @@ class Facebook(PlutoObject):
         
         top, bottom = None, None
         if exists1:
-            top = og_img[:i-1]
-            bottom_og = og_img[i:]
+            top = self.crop_rows(og_img, 0, i-1)
             bottom = img[i:]
         # else: return img
         
@@ -817,8 +1931,8 @@ class Facebook(PlutoObject):
         
         insert, engagement = None, None
         if exists2:
-            insert = bottom_og[:j]
-            engagement = bottom_og[j:]
+            insert = self.crop_rows(og_img, i, i+j)
+            engagement = self.crop_rows(og_img, i+j, None)
         
         if insert is not None and self.classify(insert) == 1:
             ts, ins = top.shape, insert.shape
@@ -837,29 +1951,15 @@ class Facebook(PlutoObject):
     def sliceing(self, img):
         """Slices the Text & header
         """
-        exptr = None
-        img = to_grayscale(img)
+        ctx = self.context(img)
+        img = ctx.grayscale()
         dm = self.dark_mode(img)
         
-        if not dm: exptr = (255 - img.copy())
-        else: exptr = img.copy()
-        
-        if not dm: exptr = expand_to_rows(exptr, True, 5)
-        else: exptr = expand_to_rows(exptr, True, 40)
-
-        slices = []
-        for i in range(1, len(exptr)):
-            if exptr[i][0] > 250 and exptr[i-1][0] < 50 or \
-            exptr[i][0] < 250 and exptr[i-1][0] > 50:
-                slices.append(i)
-
-        slc = []
+        if not dm: exptr = ctx.row_profile(True, 5, inverted=True)
+        else: exptr = ctx.row_profile(True, 40)
 
-        for i in range(1, len(slices), 2):
-            if slices[i] - slices[i-1] < 5: continue
-            slc.append(img[slices[i-1]:slices[i]])
+        slices = find_row_boundaries(exptr, 250, 50)
         
-        # return slc
         return img[slices[0]:slices[1]], img[slices[1]:slices[len(slices)-1]]
 
     def first(self, img):
@@ -872,15 +1972,13 @@ class Facebook(PlutoObject):
             The first block as np.ndarray
         """
         img = np.transpose(img, (1, 0))
-        exptr = img.copy() #pl.to_grayscale(img.copy())
-        exptr = expand_to_rows(exptr, False, 245, False)
-        # show_image(exptr)
+        exptr = row_profile(img, False, 245, False)
         
-        for i in range(1, len(exptr)):
-            if exptr[i-1][0] > 250 and exptr[i][0] < 100: break
+        falling = find_row_boundaries(exptr, 250, 100, "falling")
+        i = falling[0] if len(falling) else len(exptr) - 1
         
-        for j in range(i+1, len(exptr)):
-            if exptr[j-1][0] < 100 and exptr[j][0] > 250: break
+        rising = find_row_boundaries(exptr, 250, 100, "rising", i+1)
+        j = rising[0] if len(rising) else len(exptr) - 1
         
         # show_image(img[i:j])
         return img[i:j]
@@ -899,15 +1997,9 @@ class Facebook(PlutoObject):
         j = i
         
         # show_image(test)
-        test = expand_to_rows(test, True, 10)
-        # show_image(test)
+        test = row_profile(test, True, 10)
 
-        slices = []
-        for i in range(2, len(test)):
-            if test[i][0] > 250 and test[i-1][0] < 10 or \
-            test[i][0] < 250 and test[i-1][0] > 10:
-                slices.append(i)
-        # slices.append(len(img) - 1)
+        slices = find_row_boundaries(test, 250, 10, first=2).tolist()
         
         return slices, j
     
@@ -925,13 +2017,9 @@ class Facebook(PlutoObject):
     def engagement_str(self, ocr: str):
         """Returns shares and views from engagements
         """
-        try:
-            comsplit = ocr.split("Comments")
-            sharesplit = comsplit[1].split("Shares")
-            viewsplit = sharesplit[1].split("Views")
-            return str(sharesplit[0].strip()) + " Shares", str(viewsplit[0].strip()) + " Views"
-        except Exception as e:
-            return ocr
+        match = self.engagement_pattern.match(ocr)
+        if match is None: return ocr
+        return match.group(1).strip() + " Shares", match.group(2).strip() + " Views"
     
     def part(self, img, slices):
         """From slice arr to list of images
@@ -957,17 +2045,13 @@ class Facebook(PlutoObject):
         0 == image, 1 == text
         """
         if img is None: img = self.img
-        img = to_grayscale(img)
-        
-        net = ConvNet(1, 6, 12, 100, 20, 2)
-        net.load_state_dict(torch.load("models/general_1.pt"))
+        img = self.context(img).grayscale()
         
         device = self.determine_device()
-        net.to(device)
+        net = self.get_model(ConvNet, "models/general_1.pt", (1, 6, 12, 100, 20, 2), device)
         
         tnsr = self.to_tensor(img, 224, torch.float32, device, 1)
         
-        net.eval()
         with torch.no_grad():
             net_out = net(tnsr.to(device))[0]
             predicted_class = torch.argmax(net_out)
@@ -1028,10 +2112,7 @@ class Facebook(PlutoObject):
             Dark Mode enabled? True / False
         """
         if img is None: img = self.img
-        dim = img.shape
-        img = img[:int(dim[0]*0.1),:int(dim[0]*0.015)]
-        avg = np.average(img)
-        return avg < 220
+        return self.context(img).theme().left(0.1) < 220
 
     def split_legacy(self, img=None, darkmode=None): # -> np.ndarray
         """---
@@ -1224,10 +2305,8 @@ class Twitter(PlutoObject):
         
         self.profile_pic, self.header_info = self.header_cleanup(rows[0])
         
-        if self.bottom is not None:
-            content = [self.ocr_cleanup(self.ocr(rows[t][0])) for t in range(1, len(rows)-1)]
-        else:
-            content = [self.ocr_cleanup(self.ocr(rows[t][0])) for t in range(1, len(rows))]
+        end = len(rows) - 1 if self.bottom is not None else len(rows)
+        content = self.ocr_cleanup_many(self.ocr_many([rows[t][0] for t in range(1, end)]))
         
         content = " ".join(content)
         
@@ -1243,25 +2322,20 @@ class Twitter(PlutoObject):
         """
         if img is None: img = self.img
         
-        img_og = img.copy()
-        img_bw = to_grayscale(img_og.copy())
+        img_og = img
+        img_bw = self.context(img).grayscale()
 
-        img = expand_to_rows(to_grayscale(img[:, :int(len(img[0]) * 0.7)]), True, 150, False) # scroll bar removed
+        img = row_profile(img_bw[:, :int(len(img[0]) * 0.7)], True, 150, False) # scroll bar removed
 
-        slices = []
-        for i in range(1, len(img)):
-            if img[i][0] > 250 and img[i-1][0] < 5 or \
-                img[i][0] < 250 and img[i-1][0] > 5:
-                slices.append(i)
-        slices.append(len(img) - 1)
+        segments = find_row_segments(img, 250, 5, chain=True, end=len(img) - 1)
 
         parts = []
 
-        for i in range(1, len(slices)):
-            sliced = img_og[slices[i-1]:slices[i]]
+        for y0, y1 in segments:
+            sliced = img_og[y0:y1]
             avg = np.average(sliced)
             if avg < 250:
-                parts.append([img_og[slices[i-1]-3:slices[i]+3], img_bw[slices[i-1]-3:slices[i]+3]])
+                parts.append([img_og[y0-3:y1+3], img_bw[y0-3:y1+3]])
         
         return parts
     
@@ -1303,26 +2377,20 @@ class Twitter(PlutoObject):
 
         bwrow = np.transpose(bwrow, (1, 0))
         row = np.transpose(row, (1, 0, 2))
-        rowexptr = expand_to_rows(bwrow, True, 240, False)
-
-        imprts = []
-        for i in range(1, len(rowexptr)):
-            if rowexptr[i][0] > 250 and rowexptr[i-1][0] < 50 or \
-            rowexptr[i][0] < 250 and rowexptr[i-1][0] > 50:
-                imprts.append(i)
+        rowexptr = row_profile(bwrow, True, 240, False)
 
-        slc = []
+        segments = find_row_segments(rowexptr, 250, 50)
 
-        for i in range(1, len(imprts), 2):
-            if imprts[i] - imprts[i-1] < 5: continue
-            tempelem = np.transpose(row[imprts[i-1]:imprts[i]], (1, 0, 2))
-            tempocr = self.ocr(tempelem[int(tempelem.shape[0] / 2) :]).strip()
+        # short segments are skipped, but stay the fallback if they come last (like the original boundary loop)
+        for x0, x1 in segments:
+            if x1 - x0 < 5: continue
+            tempelem = np.transpose(row[x0:x1], (1, 0, 2))
             
-            if tempocr[0] == "@": break
+            if self.probe(tempelem[int(tempelem.shape[0] / 2) :], "@"): break
 
         row = np.transpose(row, (1, 0, 2))
-        profile_pic = row[:, :imprts[i-1]]
-        header_info = row[:, imprts[i-1]:]
+        profile_pic = row[:, :x0]
+        header_info = row[:, x0:]
         
         return profile_pic, header_info
     
@@ -1429,10 +2497,7 @@ class Twitter(PlutoObject):
             True if the header is in dark mode.
         """
         if img is not None: self.header = img
-        dim = self.header.shape
-        img = self.header[:,int(dim[1]/2):,:]
-        avg = np.average(img)
-        return avg < 150
+        return self.context(self.header).theme().right() < 150
     
     @deprecated
     def header_analyse(self, img=None, display=False):
@@ -1519,14 +2584,8 @@ class Twitter(PlutoObject):
         Returns:
             Is the screenshot in dark mode? True / False
         """
-        testimg = self.img
-        if img is not None: testimg = img.copy()
-        top_row = avg_of_row(testimg, 0, True)
-        bottom_row = avg_of_row(testimg, -1, True)
-        left_collum = avg_of_collum(testimg, 0, True)
-        right_collum = avg_of_collum(testimg, -1, True)
-        final_value = sum([top_row, bottom_row, left_collum, right_collum]) / 4
-        return final_value < 125
+        if img is None: img = self.img
+        return self.context(img).theme().dark(125)
     
     @deprecated
     def analyse_light(self):
@@ -1550,34 +2609,28 @@ class Twitter(PlutoObject):
 
         msk_inv = (255 - out[:,:,0])
 
-        out_exptr = self.expand_to_rows(msk_inv, True)
+        bright = row_profile(msk_inv, True) >= 250
 
-        header_info = []
-        continue_please = True
-        cnt = 0
-        for i in range(len(out_exptr)):
-            if continue_please:
-                if out_exptr[i][0] < 250: continue
-            else:
-                if out_exptr[i][0] < 250: break
-            header_info.append(self.img[i])
-            continue_please = False
-            # print("hey!")
-        cnt = i
+        # header: first run of bright rows
+        start = np.argmax(bright) if bright.any() else len(bright)
+        rest = np.flatnonzero(~bright[start:])
+        end = start + rest[0] if len(rest) else len(bright)
+        header_info = self.img[start:end]
+        cnt = min(end, len(bright) - 1)
 
+        # bottom: all bright rows after the header, runs separated by a spacer row
         bottom = []
         lastone = False
-        for i in range(cnt+1, len(out_exptr), 1):
-            if out_exptr[i][0] < 250:
+        for i in range(cnt+1, len(bright), 1):
+            if not bright[i]:
                 if lastone:
-                    bottom.append(self.img[3])
+                    bottom.append(3)
                     lastone = False
                 continue
-            bottom.append(self.img[i])
+            bottom.append(i)
             lastone = True
         
-        header_info = np.array(header_info)
-        bottom = np.array(bottom)
+        bottom = np.take(self.img, np.array(bottom, dtype=int), axis=0)
         
         if display:
             show_image(header_info)
@@ -1682,25 +2735,18 @@ class NYT(PlutoObject):
             An isolated part of the original screenshot, which only contains the headline\
             (optional also an inverted version, when non_header is True)
         """
-        if img is None: img = self.img.copy()
-        img_og = img.copy()
+        if img is None: img = self.img
+        img_og = img
         
         img = cv2.resize(img, (255, 255))
         img = trimm_and_blur(img, False, 30, (15, 15), [255, 255, 255], True, [0, 0, 0])
         
-        extr = expand_to_rows(img[:,:,0], True, 10)
-        extr = cv2.resize(extr[:,:10], (10, img_og.shape[0]))
-        
-        out = []
-        inverse_out = []
-        
-        for i in range(len(extr)):
-            if extr[i][0] > 200: out.append(img_og[i])
-            elif non_header: inverse_out.append(img_og[i])
+        extr = row_profile(img[:,:,0], True, 10)
+        extr = resize_profile(extr, img_og.shape[0]) > 200
         
-        out = np.array(out)
+        out = self.take_rows(img_og, extr)
         
-        if non_header: return out, inverse_out
+        if non_header: return out, self.take_rows(img_og, ~extr)
         return out
 
     def images(self, img=None, non_images=False): # -> np.ndarary | None
@@ -1718,34 +2764,16 @@ class NYT(PlutoObject):
         
         Please make sure that img is not scaled down and *not* grayscale
         """
-        if img is None: img = self.img.copy()
+        if img is None: img = self.img
         
-        img_og = img.copy()
+        img_og = img
         img = cv2.resize(img, (50, img_og.shape[0]))
         
-        image = []
-        non_image = []
-        
-        j = 0
-        stop = False
-        
-        for i in range(len(img)):
-            stop = False
-            while j < len(img[i]) and not stop:
-                pix = img[i][j]
-                minpix, maxpix = np.min(pix), np.max(pix)
-                difference = maxpix - minpix
-                if difference > 0:
-                    image.append(img_og[i])
-                    stop = True
-                
-                j += 1
-            
-            if not stop and non_images: non_image.append(img_og[i])
-            j = 0
+        # a row belongs to an image as soon as it contains one colored pixel
+        color = (img.max(axis=2) != img.min(axis=2)).any(axis=1)
         
-        image = np.array(image)
-        if non_images: non_image = np.array(non_image)
+        image = Segment.from_mask(img_og, color).image()
+        if non_images: non_image = Segment.from_mask(img_og, ~color).image()
 
         if len(image) < 1:
             image = None
@@ -1766,22 +2794,16 @@ class NYT(PlutoObject):
             An isolated part of the original screenshot, which only contains the headline\
             (optional also an inverted version, when non_header is True)
         """
-        if img is None: img = self.img.copy()
-        img_og = img.copy()
+        if img is None: img = self.img
+        img_og = img
         
         img = cv2.resize(img, (255, 255))
         img = trimm_and_blur(img, False, 55, (15, 15), [255, 255, 255], True, [0, 0, 0])
         
-        extr = expand_to_rows(img[:,:,0], True, 10)
-        extr = cv2.resize(extr[:,:10], (10, img_og.shape[0]))
-        # show_image(extr)
-        out = []
-        
-        for i in range(len(extr)):
-            if extr[i][0] > 200: out.append(img_og[i])
+        extr = row_profile(img[:,:,0], True, 10)
+        extr = resize_profile(extr, img_og.shape[0]) > 200
         
-        out = np.array(out)
-        return out
+        return self.take_rows(img_og, extr)
     
     def analyse(self, img=None):
         """Main method for extraction information from a screenshot of a NYT article.
@@ -1790,20 +2812,9 @@ class NYT(PlutoObject):
         if analyse_img is None: analyse_img = self.img
         
         sliced_result = self.slice(analyse_img)
-        top, color_images, bottomnp = None, None, None
+        top, color_images, bottom = None, None, None
         if len(sliced_result) == 1: top = sliced_result[0]
-        elif len(sliced_result) == 3: top, color_images, bottomnp = sliced_result
-        # show_image(color_images)
-        # show_image(np.array(top))
-        
-        bottom = []
-        if bottomnp is not None:
-            for i in range(len(bottomnp)):
-                bottom += (bottomnp[i]).tolist()
-        
-        top = np.array(top, np.uint8)
-        if bottomnp is None: bottom = None
-        else: bottom = np.array(bottom, np.uint8)
+        elif len(sliced_result) == 3: top, color_images, bottom = sliced_result
         
         # show_image(top)
         # show_image(color_images)
@@ -1814,13 +2825,13 @@ class NYT(PlutoObject):
         # show_image(body)
         # return head, body
         
-        self.headline = self.ocr_cleanup(self.ocr(head))
+        # headline & subtitle are read concurrently (see ocr_async()) while the author is searched
+        headline = self.ocr_async(head)
+        subtitle = self.ocr_async(self.suber(body))
         author = self.author(bottom)
-        # print(headline)
         
-        # print(type(body))
-        subt = self.suber(np.array(body))
-        subtitle = self.ocr_cleanup(self.ocr(subt))
+        self.headline = self.ocr_cleanup(headline.result())
+        subtitle = self.ocr_cleanup(subtitle.result())
         
         return self.headline, subtitle, author
     
@@ -1830,42 +2841,27 @@ class NYT(PlutoObject):
         Returns:
             top, image, bottom
         """
-        if img is None: img = self.img.copy()
-        
-        img_og = img.copy()
-        
-        # show_image(img[:, :int(len(img[0]) * 0.9)])
-        img = expand_to_rows(to_grayscale(img[:, :int(len(img[0]) * 0.9)]), True, 248, False) # scroll bar removed
-        # show_image(img)
+        if img is None: img = self.img
         
-        slices = []
-        for i in range(1, len(img)):
-            if img[i][0] > 250 and img[i-1][0] < 5 or \
-                img[i][0] < 250 and img[i-1][0] > 5:
-                slices.append(i)
-        slices.append(len(img) - 1)
+        img_og = img
         
-        parts = []
+        img = row_profile(self.context(img).grayscale()[:, :int(len(img[0]) * 0.9)], True, 248, False) # scroll bar removed
         
-        for i in range(1, len(slices)):
-            parts.append(img_og[slices[i-1]:slices[i]])
-            # show_image(img_og[slices[i-1]:slices[i]])
+        segments = find_row_segments(img, 250, 5, chain=True, end=len(img) - 1)
+        if len(segments) == 0: return [img_og[:0]]
         
-        top = []
+        # the segments are contiguous, so top & bottom are plain views of the screenshot
+        start, end = segments[0][0], segments[-1][1]
+        color = (img_og.max(axis=2) - img_og.min(axis=2)) > 10
         difflen = 0
         
-        for i in range(len(parts)):
-            temp = parts[i]
-            for row in temp:
-                for pix in row:
-                    minpix, maxpix = np.min(pix), np.max(pix)
-                    difference = maxpix - minpix
-                    if difference > 10: difflen += 1
-                    if difflen > 50:
-                        if self.classify(temp) == 0: return top, temp, parts[i+1:]
-            top += temp.tolist()
+        for y0, y1 in segments:
+            temp = img_og[y0:y1]
+            difflen += np.count_nonzero(color[y0:y1])
+            if difflen > 50 and temp.size > 0:
+                if self.classify(temp) == 0: return self.crop_rows(img_og, start, y0), temp, self.crop_rows(img_og, y1, end)
         
-        return [top]
+        return [self.crop_rows(img_og, start, end)]
     
     def classify(self, img=None):
         """Image or still part of text?
@@ -1873,15 +2869,11 @@ class NYT(PlutoObject):
         if img is None: img = self.img
         img = to_grayscale(img)
         
-        net = ConvNet(1, 6, 12, 100, 20, 2)
-        net.load_state_dict(torch.load("models/general_1.pt"))
-        
         device = self.determine_device()
-        net.to(device)
+        net = self.get_model(ConvNet, "models/general_1.pt", (1, 6, 12, 100, 20, 2), device)
         
         tnsr = self.to_tensor(img, 224, torch.float32, device, 1)
         
-        net.eval()
         with torch.no_grad():
             net_out = net(tnsr.to(device))[0]
             predicted_class = torch.argmax(net_out)
@@ -1897,24 +2889,24 @@ class NYT(PlutoObject):
         """
         if img is None: return None
         
-        img_og = img.copy()
-        img = expand_to_rows(to_grayscale(img), True, 80, False)
-        # show_image(img)
-        
-        slices = []
-        for i in range(1, len(img)):
-            if img[i][0] > 250 and img[i-1][0] < 5 or \
-                img[i][0] < 250 and img[i-1][0] > 5:
-                slices.append(i)
-        slices.append(len(img) - 1)
+        img_og = img
+        img = row_profile(self.context(img).grayscale(), True, 80, False)
         
-        parts = []
+        segments = find_row_segments(img, 250, 5, chain=True, end=len(img) - 1)
         
-        for i in range(1, len(slices)):
-            parts.append(img_og[slices[i-1]:slices[i]])
+        parts = [img_og[y0:y1] for y0, y1 in segments]
         
-        for p in parts:
-            ocr_result = self.ocr_cleanup(self.ocr(p))
+        # the parts are probed in order, stopping at the first one that reads "By " in full OCR.
+        # If no probe hits, the remaining parts get a full OCR pass each, like before
+        read = set()
+        for i, p in enumerate(parts):
+            if not self.probe(p, "By "): continue
+            read.add(i)
+            ocr_result = self.ocr_cleanup(self.ocr(p, mode="auto"))
+            if "By " in ocr_result: return ocr_result[3:]
+        for i, p in enumerate(parts):
+            if i in read: continue
+            ocr_result = self.ocr_cleanup(self.ocr(p, mode="auto"))
             if "By " in ocr_result: return ocr_result[3:]
         
         return None
@@ -1949,41 +2941,36 @@ class NYT(PlutoObject):
             The image excert of the headline and the y coordinate where the excert ends
         """
         if img is None: img = self.img
+        return self.headline_from_blocks(img, text_blocks.detect([img])[0])
+    
+    def headlines_using_yolo(self, imgs):  # -> list
+        """headline_using_yolo() for a batch of screenshots, the text blocks of all of them are detected in one call
         
-        detect_text_block = self.load_model_from_github(weights="models/text_block.pt")
-        
-        result = detect_text_block(img)
-
-        text_blocks = []
-
-        # process yolo results
-        xyxy = result.xyxy[0].cpu().numpy()
-        for i in range(len(xyxy)):
-            xyxyc = result.xyxy[0].cpu().numpy()[i]
-            
-            excert = img[int(xyxyc[1]) : int(xyxyc[3]), int(xyxyc[0]) : int(xyxyc[2])]
-            y_center = int(xyxyc[3] - xyxyc[1]) / 2
-            
-            text_blocks.append([excert, xyxyc, y_center, np.min(excert), np.max(excert)])
-
-        # sort detected areas from top to bottom
-        text_blocks.sort(key=lambda text_block: text_block[2])
-        
-        # check if excert has correct color to be the headline
-        headline_img = None
-        headline_y_end = None
-
-        for tb in text_blocks:
-            if headline_img is None:
-                if tb[3] < 25:
-                    # this is the headline block, widen selected area if necessary
-                    x_min = int(min(tb[1][0], img.shape[1]*0.05))
-                    x_max = int(max(tb[1][3], img.shape[1]*0.95))
-                    
-                    headline_img = img[int(tb[1][1]) : int(tb[1][3]), x_min : x_max]
-                    headline_y_end = int(tb[1][3])
+        Returns:
+            One (headline excert, y coordinate where it ends) tuple per screenshot
+        """
+        return [self.headline_from_blocks(img, boxes) for img, boxes in zip(imgs, text_blocks.detect(imgs))]
+    
+    def headline_from_blocks(self, img, boxes):  # -> tuple
+        """Picks the headline out of the detected text blocks: the topmost block with dark (headline colored) pixels
         
-        return headline_img, headline_y_end
+        Args:
+            img: the screenshot
+            boxes: the text blocks, see TextBlockDetector.detect()
+        """
+        # sort detected areas from top to bottom (by their vertical center)
+        boxes = boxes[np.argsort((boxes[:, 1] + boxes[:, 3]) / 2, kind="stable")]
+        
+        for x0, y0, x1, y1 in boxes[:, :4].astype(int):
+            excert = img[y0:y1, x0:x1]
+            # check if excert has correct color to be the headline
+            if excert.size == 0 or excert.min() >= 25: continue
+            # this is the headline block, widen selected area if necessary
+            x_min = int(min(x0, img.shape[1]*0.05))
+            x_max = int(max(x1, img.shape[1]*0.95))
+            return img[y0:y1, x_min:x_max], int(y1)
+        
+        return None, None
     
     def search(self, query: str):
         """Searches a query with the NYT's search function. Opens result in browser window.
@@ -2003,6 +2990,8 @@ class NYT(PlutoObject):
         self.search(self.headline)
 
 class Tagesschau(PlutoObject):
+    ocr_languages = ["de", "en"]
+    
     def __init__(self, img: np.ndarray):
         super().__init__(img)
     
@@ -2012,8 +3001,7 @@ class Tagesschau(PlutoObject):
         if img is None: img = self.img
         
         dm = self.dark_mode(img)
-        img = to_grayscale(img)
-        # show_image(img)
+        img = self.context(img).grayscale()
         
         s = self.remove_image(img, dm)
         if len(s) == 2:
@@ -2058,16 +3046,13 @@ class Tagesschau(PlutoObject):
             if stop: break
         
         image = screenshot[i:j]
-        text = np.delete(screenshot, range(i, j), 0)
+        text = self.take_rows(screenshot, np.r_[0:i, j:len(screenshot)])
         
         # confirm suspected image
-        net = ConvNet(1, 6, 12, 100, 20, 2)
-        net.load_state_dict(torch.load("models/general_1.pt"))
-        
         device = self.determine_device()
+        net = self.get_model(ConvNet, "models/general_1.pt", (1, 6, 12, 100, 20, 2), device)
         tnsr = self.to_tensor(image, 224, torch.float32, device, 1)
         
-        net.to(device).eval()
         with torch.no_grad():
             net_out = net(tnsr.to(device))[0]
             predicted_class = torch.argmax(net_out)
@@ -2086,34 +3071,18 @@ class Tagesschau(PlutoObject):
         Returns:
             A list of slices
         """
-        if img is None: img = self.img.copy()
-        og_img = img.copy()
+        if img is None: img = self.img
+        og_img = img
         img_dim = img.shape
         if dm:
-            exptr = 255 - expand_to_rows(img[:, :int(img_dim[0]*0.5)], True, 80)
-        else: exptr = expand_to_rows(img[:, :int(img_dim[0]*0.5)], True, 150, False)
+            exptr = 255 - row_profile(img[:, :int(img_dim[0]*0.5)], True, 80)
+        else: exptr = row_profile(img[:, :int(img_dim[0]*0.5)], True, 150, False)
         
-        zero = np.zeros((1, int(img_dim[0]*0.5)), dtype=np.uint8)
-        full = 255 - zero
+        exptr = np.where(exptr < 125, 0, 255)
         
-        for i in range(len(exptr)):
-            if exptr[i][0] < 125: exptr[i] = zero
-            else: exptr[i] = full
-        
-        # show_image(exptr)
-
-        slices = []
-        if exptr[0][0] < 50: slices.append(0)
-        for i in range(1, len(exptr)):
-            if exptr[i-1][0] > 250 and exptr[i][0] < 50: # or \
-            # exptr[i][0] > 250 and exptr[i-1][0] < 50:
-                slices.append(i)
-
-        slc = []
+        segments = find_row_segments(exptr, 250, 50, 5, "falling", chain=True, start=0 if exptr[0] < 50 else None)
 
-        for i in range(1, len(slices), 1):
-            if slices[i] - slices[i-1] < 5: continue
-            slc.append(og_img[slices[i-1]:slices[i]])
+        slc = [og_img[y0:y1] for y0, y1 in segments]
         
         # for s in slc: show_image(s)
         
@@ -2131,10 +3100,12 @@ class Tagesschau(PlutoObject):
         """
         slc = []
         
-        for s in slices:
-            if not dm: s = 255 - s
+        inverted = slices if dm else [255 - s for s in slices]
+        # in single pass mode the text is taken from the boxes of the screenshot, which the slices (not their inversions) are views of
+        ocrresults = self.ocr_many(slices if self.single_pass else inverted, mode="auto")
+        
+        for s, s_ocr in zip(inverted, self.ocr_cleanup_many(ocrresults)):
             # show_image(s)
-            s_ocr = self.ocr_cleanup(self.ocr(s))
             s = s[:, :int(s.shape[1]*0.5)]
             m = np.max(s)
             slc.append([s, s_ocr, m])
@@ -2145,20 +3116,15 @@ class Tagesschau(PlutoObject):
             if slc[s][2] < 200 and "Stand:" in slc[s][1]: break
         
         pubsplit = slc[s][1][7:]
-        content = ""
-        title = ""
+        content = " ".join(line[1] for line in slc[s+1:])
+        title = []
         category = ""
         
-        for i in range(s+1, len(slc)):
-            content += slc[i][1] + " "
-        
-        for i in range(s):
-            if slc[i][1][-2:] == "AA":
-                category = slc[i][1][:-2]
-                continue
-            title += slc[i][1] + " "
+        for line in slc[:s]:
+            if line[1].endswith("AA"): category = line[1][:-2]
+            else: title.append(line[1])
         
-        return pubsplit.strip(), category.strip(), title.strip(), content.strip()
+        return pubsplit.strip(), category.strip(), " ".join(title).strip(), content.strip()
     
     def to_json(self, img=None, path=None):
         """Extracts information from screenshot and saves it as json file.
@@ -2198,11 +3164,7 @@ class Tagesschau(PlutoObject):
             Dark Mode enabled? True / False
         """
         if img is None: img = self.img
-        dim = img.shape
-        img = img[:, :int(dim[0]*0.02)]
-        # show_image(img)
-        avg = np.average(img)
-        return avg < 150
+        return self.context(img).theme().left() < 150
     
     # previous version
     def analyse2(self, img=None):
@@ -2365,13 +3327,12 @@ class WPost(PlutoObject):
         
         iso_top = iso_grayscale(img_top.copy(), False, 230, True, (10, 10))
         # show_image(iso_top)
-        iso_expt = expand_to_rows(iso_top[:, :int(iso_top.shape[1] / 3)], True, 20)
-        # show_image(iso_expt)
+        iso_expt = row_profile(iso_top[:, :int(iso_top.shape[1] / 3)], True, 20)
         
         category = []
         headline = []
         for i in range(len(iso_expt)):
-            if iso_expt[i][0] > 100: category.append(img_top[i])
+            if iso_expt[i] > 100: category.append(img_top[i])
             else: headline.append(img[i])
         
         category = np.array(category)
@@ -2389,17 +3350,16 @@ class WPost(PlutoObject):
         
         iso = iso_grayscale(img, False, 235, True, (10, 10))
         # show_image(iso)
-        iso = expand_to_rows(iso, True, 10)
-        # show_image(iso)
+        iso = row_profile(iso, True, 10)
         
         out = []
         body = []
         t = None
         for i in range(len(img)-2, 0, -1):
-            if iso[i+1][0] < 100 and iso[i][0] > 100:
+            if iso[i+1] < 100 and iso[i] > 100:
                 body = img[i:]
                 t = i
-            elif iso[i+1][0] > 100 and iso[i][0] < 100: break
+            elif iso[i+1] > 100 and iso[i] < 100: break
         out = img[i:t]
         
         out = np.array(out)
@@ -2421,14 +3381,13 @@ class WPost(PlutoObject):
         
         iso = iso_grayscale(img, False, 180, True, (10, 10))
         # show_image(iso)
-        iso = expand_to_rows(iso, True, 10)
-        # show_image(iso)
+        iso = row_profile(iso, True, 10)
         
         body = []
         date = []
         
-        for i in range(1, len(img), 1):
-            if iso[i][0] < 200 and iso[i-1][0] > 200: break
+        falling = find_row_boundaries(iso, 200, 200, "falling")
+        i = falling[0] if len(falling) else len(img) - 1
         
         out = img[:i]
         body = img[i:]
@@ -2455,42 +3414,19 @@ class WPost(PlutoObject):
         
         Please make sure that img is not scaled down and *not* grayscale
         """
-        if img is None: img = self.img.copy()
+        if img is None: img = self.img
         
-        img_og = img.copy()
+        img_og = img
         img = cv2.resize(img, (50, img_og.shape[0]))
         
-        image = []
-        non_image_top = []
-        non_image_bottom = []
-        
-        j = 0
-        stop = False
-        color_start = False
-        
-        for i in range(len(img)):
-            stop = False
-            while j < len(img[i]) and not stop:
-                pix = img[i][j]
-                minpix, maxpix = np.min(pix), np.max(pix)
-                difference = maxpix - minpix
-                if difference > 0:
-                    image.append(img_og[i])
-                    stop = True
-                
-                j += 1
-            
-            if stop: color_start = True
-            
-            if not stop and non_images:
-                if color_start: non_image_bottom.append(img_og[i])
-                else: non_image_top.append(img_og[i])
-            j = 0
+        # a row belongs to an image as soon as it contains one colored pixel
+        color = (img.max(axis=2) != img.min(axis=2)).any(axis=1)
         
-        image = np.array(image)
+        image = Segment.from_mask(img_og, color).image()
         if non_images:
-            non_image_top = np.array(non_image_top)
-            non_image_bottom = np.array(non_image_bottom)
+            first_color = np.argmax(color) if color.any() else len(color)
+            non_image_top = img_og[:first_color]
+            non_image_bottom = Segment.from_mask(img_og[first_color:], ~color[first_color:]).image()
 
         if len(image) < 1:
             image = None
@@ -2504,6 +3440,8 @@ class Bild(PlutoObject):
         super().__init__(img)
 
 class Spiegel(PlutoObject):
+    ocr_languages = ["de", "en"]
+    
     def __init__(self, img: np.ndarray):
         super().__init__(img)
         self.headline = False
@@ -2518,11 +3456,10 @@ class Spiegel(PlutoObject):
         
         headline_img, subtitle_img = self.header_split(header)
         
-        headline = self.ocr_cleanup(self.ocr(headline_img))
-        subtitle = self.ocr_cleanup(self.ocr(subtitle_img))
-        date = self.ocr_cleanup(self.ocr(date_img))
+        fields = [self.ocr_async(crop) for crop in (category, headline_img, subtitle_img, date_img)]
+        category, headline, subtitle, date = self.ocr_cleanup_many([f.result() for f in fields])
         
-        return self.ocr_cleanup(self.ocr(category)), headline, subtitle, date
+        return category, headline, subtitle, date
     
     def to_json(self, img=None, path=None):
         """Extracts information from screenshot and saves it as json file.
@@ -2559,25 +3496,17 @@ class Spiegel(PlutoObject):
         
         gray = to_grayscale(img[:, :int(img.shape[1] / 2), :])
         
-        header = []
-        top_header = []
-        bottom_header = []
-        
-        gray = expand_to_rows(gray, True, 10, False)
+        gray = row_profile(gray, True, 10, False)
         
         pntr = 0
         pntr2 = len(gray)-1
-        while gray[pntr][0] != 0:
-            pntr += 1
-            top_header.append(img[pntr])
-        
-        while gray[pntr2][0] != 0:
-            pntr2 -= 1
-            bottom_header.insert(0, img[pntr2])
+        while gray[pntr] != 0: pntr += 1
+        while gray[pntr2] != 0: pntr2 -= 1
         
-        top_header = np.array(top_header)
+        # views of the screenshot, so their text can be taken from a single OCR pass (see PlutoObject.field_text())
+        top_header = img[1:pntr+1]
         header = img[pntr:pntr2]
-        bottom_header = np.array(bottom_header)
+        bottom_header = img[pntr2:len(gray)-1]
         
         if display:
             show_image(top_header)
@@ -2589,7 +3518,7 @@ class Spiegel(PlutoObject):
     def header_split(self, img=None, display = False):
         if img is None: img = self.img
         
-        img_og = img.copy()
+        img_og = img
         
         img = cv2.resize(to_grayscale(img), (600, 600))
         img = cv2.blur(img, (40, 40))
@@ -2617,37 +3546,29 @@ class Spiegel(PlutoObject):
     def images(self, img=None):
         if img is None: img = self.img
         
-        image = []
-        non_image = []
+        non_image = (img[:, 0, :3] > 250).all(axis=1)
         
-        for i in range(len(img)):
-            pix = img[i][0]
-            if pix[0] > 250 and pix[1] > 250 and pix[2] > 250:
-                non_image.append(img[i])
-            else: image.append(img[i])
-        
-        return np.array(image), np.array(non_image)
+        return self.take_rows(img, ~non_image), self.take_rows(img, non_image)
     
     def bottom(self, img=None):
         if img is None: img = self.img
         
-        img_og = img.copy()
+        img_og = img
         
         img = to_grayscale(img)
-        img = expand_to_rows(img, True, 200, False)
+        img = row_profile(img, True, 200, False)
         
-        out = []
         for i in range(5, len(img)):
-            if img[i][0] == 0: break
+            if img[i] == 0: break
         
-        for j in range(i, len(img)):
-            if img[j][0] == 0:
-                out.append(img_og[j])
-            else: break
+        end = i
+        while end < len(img) and img[end] == 0: end += 1
         
-        return np.array(out)
+        return img_og[i:end]
 
 class WELT(PlutoObject):
+    ocr_languages = ["de", "en"]
+    
     def __init__(self, img: np.ndarray):
         super().__init__(img)
     
@@ -2658,17 +3579,16 @@ class WELT(PlutoObject):
         
         cat, slices = self.split(img)
         
-        headline, author, date = "", "", ""
-        category = self.ocr_cleanup(self.ocr(cat))
+        headline, author, date = [], "", ""
+        ocrresults = self.ocr_cleanup_many(self.ocr_many([cat] + slices))
+        category = ocrresults[0]
         
-        for s in slices:
-            ocrresult = self.ocr_cleanup(self.ocr(s))
-            
-            if ocrresult[:4] == "Von ": author = ocrresult[4:]
-            elif ocrresult[:7] == "Stand: ": date = ocrresult[6:]
-            else: headline += " " + ocrresult
+        for ocrresult in ocrresults[1:]:
+            if ocrresult.startswith("Von "): author = ocrresult[4:]
+            elif ocrresult.startswith("Stand: "): date = ocrresult[6:]
+            else: headline.append(ocrresult)
         
-        return headline, author, date, category
+        return "".join(" " + h for h in headline), author, date, category
     
     def to_json(self, img=None, path=None):
         """Extracts information from screenshot and saves it as json file.
@@ -2701,47 +3621,30 @@ class WELT(PlutoObject):
     def split(self, img=None, display=True):
         if img is None: img = self.img
         
-        img_og = img.copy()
+        img_og = img
         
-        img = to_grayscale(img)
+        img = self.context(img).grayscale()
         # show_image(img)
         
         images, img = self.images(img)
         
-        img = expand_to_rows(img, True, 30, False)
-        # show_image(img)
-        
-        category = []
-        sliceindx = []
-        slices = []
+        img = row_profile(img, True, 30, False)
         
         for i in range(len(img)):
-            if img[i][0] == 0: break
+            if img[i] == 0: break
         category = img_og[:i]
         
-        sliceindx.append(i)
-        for j in range(i+1, len(img)):
-            if img[j-1][0] < 100 and img[j][0] > 250: sliceindx.append(j)
-        
-        # print(sliceindx)
-        for i in range(1, len(sliceindx), 1):
-            if sliceindx[i] - sliceindx[i-1] < 5: continue
-            slices.append(img_og[sliceindx[i-1]:sliceindx[i]])
+        segments = find_row_segments(img, 250, 100, 5, "rising", i+1, chain=True, start=i)
+        slices = [img_og[y0:y1] for y0, y1 in segments]
         
         return category, slices
     
     def images(self, img=None):
         if img is None: img = self.img
     
-        image = []
-        non_image = []
-        
-        for i in range(len(img)):
-            if img[i][0] > 250:
-                non_image.append(img[i])
-            else: image.append(img[i])
+        non_image = img[:, 0] > 250
         
-        return np.array(image), np.array(non_image)
+        return Segment.from_mask(img, ~non_image).image(), Segment.from_mask(img, non_image).image()
 
 class Discord(PlutoObject):
     def __init__(self, img: np.ndarray):
@@ -2760,10 +3663,9 @@ class Discord(PlutoObject):
                 if img[i][j] > 117 and img[i][j] < 123: img[i][j] = 59
         
         # show_image(img)
-        exptr = expand_to_rows(img.copy(), False, 100)
-        # show_image(exptr)
-        for i in range(1, len(exptr)):
-            if exptr[i-1][0] > 200 and exptr[i][0] < 200: break
+        exptr = row_profile(img, False, 100)
+        falling = find_row_boundaries(exptr, 200, 200, "falling")
+        i = falling[0] if len(falling) else len(exptr) - 1
         
         img = img[i:]
         indx = i
@@ -2780,43 +3682,32 @@ class Discord(PlutoObject):
         
         # show_image(imgb)
         
-        iso1 = expand_to_rows(img.copy(), True, 254)
+        iso1 = row_profile(img, True, 254)
         iso1 = self.fix_slices(iso1)
-        # show_image(iso1)
         slices = self.slice_chat(og_img[:, indx:] , iso1)
-        out = []
+        crops = []
         
         for i in slices:
             # show_image(i)
             info, body = self.split(i)
             name, info = self.nameinfo(info)
-            name_ocr = self.ocr_cleanup(self.ocr(name))
-            info_ocr = self.ocr_cleanup(self.ocr(info))
-            body_ocr = self.ocr_cleanup(self.ocr(body))
             # show_image(name)
             # show_image(info)
             # show_image(body)
-            out.append([name_ocr, info_ocr, body_ocr])
+            crops += [name, info, body]
         
-        return out
+        texts = self.ocr_cleanup_many(self.ocr_many(crops, mode="auto"))
+        
+        return [texts[i:i + 3] for i in range(0, len(texts), 3)]
     
     def fix_slices(self, img=np.ndarray):
-        """Fix mini slices
+        """Fix mini slices (img is a row profile, see row_profile())
         """
         new_img = img.copy()
-        slices = []
-        
-        for i in range(2, len(img)):
-            if img[i][0] > 250 and img[i-1][0] < 200:
-                slices.append(i)
-        # print(slices)
         
-        for i in range(1, len(slices)):
-            if (slices[i] - slices[i-1]) < 10:
-                fix = (255 - np.zeros(((slices[i] - slices[i-1]), len(img[0])), np.uint8))
-                new_img[slices[i-1]:slices[i]] = fix
+        for y0, y1 in find_row_segments(img, 250, 200, edges="rising", first=2, chain=True):
+            if (y1 - y0) < 10: new_img[y0:y1] = 255
         
-        # show_image(new_img)
         return new_img
     
     def to_json(self, img=None, path=None):
@@ -2840,34 +3731,27 @@ class Discord(PlutoObject):
         
         img = np.transpose(img, (1, 0))
         # show_image(img)
-        img_exptr = expand_to_rows(img.copy(), True, 75)
+        img_exptr = row_profile(img, True, 75)
         
         out = []
         
-        for i in range(1, len(img_exptr)):
-            if img_exptr[i-1][0] > 230 and img_exptr[i][0] < 230:
-                out = img[i:]
-                break
+        falling = find_row_boundaries(img_exptr, 230, 230, "falling")
+        if len(falling): out = img[falling[0]:]
         
         out = np.transpose(out, (1, 0))
         return out
     
     def slice_chat(self, img=np.ndarray, mark=np.ndarray):
-        """Slices a chat screenshot into images of one message
+        """Slices a chat screenshot into images of one message (mark is a row profile, see row_profile())
         """
-        slices = []
         out = []
         
-        for i in range(2, len(mark)):
-            if mark[i][0] > 250 and mark[i-1][0] < 200:
-                slices.append(i)
-        slices.append(len(mark))
-        # print(slices)
+        segments = find_row_segments(mark, 250, 200, edges="rising", first=2, chain=True, end=len(mark))
         
         prev = 10
-        for i in range(1, len(slices)):
-            if slices[i-1] - prev < 1: prev = 0
-            temp = img[slices[i-1]-prev:slices[i]-prev]
+        for y0, y1 in segments:
+            if y0 - prev < 1: prev = 0
+            temp = img[y0-prev:y1-prev]
             # show_image(temp)
             # try:
             #     temp = self.remove_usericon(temp)
@@ -2886,18 +3770,11 @@ class Discord(PlutoObject):
         
         img_og = img.copy()
         img = to_grayscale(img)
-        img = expand_to_rows(img[:,:int(img.shape[1] / 2)], False, 250)
+        img = row_profile(img[:,:int(img.shape[1] / 2)], False, 250)
         
-        for i in range(len(img)-1, 1, -1):
-            if img[i-1][0] > 230 and img[i][0] < 230:
-                img = img_og[:i]
-                img2 = img_og[i:]
-                break
-        
-        # show_image(img)
-        # show_image(img2)
+        i = find_row_boundaries(img, 230, 230, "falling", 2)[-1]
         
-        return img, img2
+        return img_og[:i], img_og[i:]
     
     def nameinfo(self, img=None):
         """Splits the info part of a chat slice into name and date (info) parts 
@@ -2931,8 +3808,7 @@ class FBM(PlutoObject):
         slices = self.slice(img, self.darkmode(img))
         msg = []
         
-        for slc in slices:
-            io = self.io_classification(slc)
+        for slc, io in zip(slices, self.io_classification_batch(slices)):
             try:
                 message = self.ocr_cleanup(self.ocr(slc))
                 if io == 0: msg.append(["received", message])
@@ -2978,22 +3854,15 @@ class FBM(PlutoObject):
         """Send or Recived?
         """
         if img is None: img = self.img
-        
-        net = ConvNet(3, 6, 12, 100, 50, 2)
-        net.load_state_dict(torch.load("models/fbm2.pt"))
-        
+        return self.io_classification_batch([img])[0]
+    
+    def io_classification_batch(self, slices, batch_size=None):  # -> np.ndarray
+        """Send or Recived? for all message slices of a screenshot, in batched forward passes.
+        0 == received, 1 == send
+        """
         device = self.determine_device()
-        net.to(device)
-        
-        tnsr = self.to_tensor(img, 224, torch.float32, device)
-        
-        net.eval()
-        with torch.no_grad():
-            net_out = net(tnsr.to(device))[0]
-            predicted_class = torch.argmax(net_out)
-        result = predicted_class.cpu().numpy()
-        
-        return result
+        net = self.get_model(ConvNet, "models/fbm2.pt", (3, 6, 12, 100, 50, 2), device)
+        return self.classify_batch(net, slices, 224, 3, batch_size, device)
     
     def slice(self, img=None, dm=False): #  --> List
         """Slices a screenshot of a chat into images of individual messages.
@@ -3005,26 +3874,15 @@ class FBM(PlutoObject):
         
         if dm: img = to_grayscale(img)
         else: img = (255 - to_grayscale(img))
-        test = expand_to_rows(img, True, 5)
+        test = row_profile(img, True, 5)
 
-        slices = []
-        for i in range(2, len(test)):
-            if test[i][0] > 250 and test[i-1][0] < 10:
-                slices.append(i)
-        slices.append(len(img) - 1)
+        segments = find_row_segments(test, 250, 10, edges="rising", first=2, chain=True, end=len(img) - 1)
 
         parts = []
 
-        for i in range(1, len(slices)):
-            temp = og_img[slices[i-1]:slices[i]]
-            temp2 = to_grayscale(temp.copy())
-            cnt = False
-            for row in temp2:
-                for pix in row:
-                    if pix > 253:
-                        cnt = True
-                        break
-            if not cnt: continue
+        for y0, y1 in segments:
+            temp = og_img[y0:y1]
+            if not (to_grayscale(temp) > 253).any(): continue
             
             parts.append(temp)
         
@@ -3038,19 +3896,14 @@ class FBM(PlutoObject):
         if img is None: img = self.img
         
         # show_image(img)
-        test = expand_to_rows(to_grayscale(img), True, 250, False)
-        # show_image(test)
+        test = row_profile(to_grayscale(img), True, 250, False)
 
-        slices = []
-        for i in range(2, len(test)):
-            if test[i][0] > 250 and test[i-1][0] < 10:
-                slices.append(i)
-        slices.append(len(img) - 1)
+        segments = find_row_segments(test, 250, 10, edges="rising", first=2, chain=True, end=len(img) - 1)
 
         parts = []
 
-        for i in range(1, len(slices)):
-            temp = img[slices[i-1]:slices[i]]
+        for y0, y1 in segments:
+            temp = img[y0:y1]
             # temp2 = to_grayscale(temp.copy())
             # cnt = False
             # for row in temp2:
@@ -3100,14 +3953,12 @@ class FBM(PlutoObject):
         """
         if img is None: img = self.img
         
-        img_exptr = np.transpose(img.copy(), (1, 0))
         img = np.transpose(img, (1, 0))
-        img_exptr = expand_to_rows(img_exptr, True, 250)
-        # show_image(img_exptr)
+        img_exptr = row_profile(img, True, 250)
         
         out = []
         for i in range(len(img_exptr)):
-            if img_exptr[i][0] > 250: out.append(img[i])
+            if img_exptr[i] > 250: out.append(img[i])
         out = np.array(out)
         # show_image(out)
         
@@ -3133,10 +3984,7 @@ class FBM(PlutoObject):
             Dark Mode enabled? True / False
         """
         if img is None: img = self.img
-        dim = img.shape
-        img = img[:int(dim[0]*0.1),:int(dim[0]*0.02)]
-        avg = np.average(img)
-        return avg < 200
+        return self.context(img).theme().left(0.1) < 200
     
     def to_json(self, img=None, path=None):
         if img is None: img = self.img.copy()
@@ -3167,10 +4015,9 @@ class WhatsApp(PlutoObject):
         slices = self.sliceit(img)
         msg = []
         
-        for slc in slices:
-            io = self.io_classification(slc)
+        for slc, io in zip(slices, self.io_classification_batch(slices)):
             try:
-                message = self.ocr_cleanup(self.ocr(slc))
+                message = self.ocr_cleanup(self.ocr(slc, mode="auto"))
                 if io == 1: msg.append(["received", message])
                 else: msg.append(["send", message])
             except Exception as e: print(e)
@@ -3197,45 +4044,30 @@ class WhatsApp(PlutoObject):
         """
         img = img[:, int(img.shape[1] / 50) : int(img.shape[1] - (img.shape[1] / 50))]
 
-        exptr = expand_to_rows(to_grayscale(img.copy()), True, 45)
+        exptr = row_profile(to_grayscale(img), True, 45)
 
-        slice_indx = []
-
-        for i in range(len(exptr)):
-            if exptr[i][0] > 250 and exptr[i-1][0] < 100 or \
-            exptr[i][0] < 250 and exptr[i-1][0] > 100:
-                slice_indx.append(i)
-
-        slices = []
-
-        for i in range(1, len(slice_indx), 2):
-            if slice_indx[i] - slice_indx[i-1] < 5: continue
-            slices.append(img[slice_indx[i-1]:slice_indx[i]])
+        segments = find_row_segments(exptr, 250, 100, 5, first=0)
     
-        return slices
+        return [img[y0:y1] for y0, y1 in segments]
     
     def io_classification(self, img=None):
         """Send or Recived?
         """
-        net = ConvNet(3, 6, 12, 300, 20, 2)
-        net.load_state_dict(torch.load("models/wa1.pt"))
-
-        util = PlutoObject(None)
-        device = util.determine_device()
-        net.to(device)
-        
-        tnsr = util.to_tensor(img, 224, torch.float32, device)
+        return self.io_classification_batch([img])[0]
     
-        net.eval()
-        with torch.no_grad():
-            net_out = net(tnsr.to(device))[0]
-            predicted_class = torch.argmax(net_out)
-        result = predicted_class.cpu().numpy()
-        
-        return result
+    def io_classification_batch(self, slices, batch_size=None):  # -> np.ndarray
+        """Send or Recived? for all message slices of a screenshot, in batched forward passes.
+        0 == send, 1 == received
+        """
+        device = self.determine_device()
+        net = self.get_model(ConvNet, "models/wa1.pt", (3, 6, 12, 300, 20, 2), device)
+        return self.classify_batch(net, slices, 224, 3, batch_size, device)
 
 # cli execution
 if __name__ == "__main__":
+    configure_ocr(args.ocr_lang.split(",") if args.ocr_lang else None, args.ocr_model_dir)
+    models.runtime = args.runtime
+    models.quantize = args.int8
     try:
         img = None
         if arg_i is None: img = grab_clipboard()
@@ -3349,6 +4181,8 @@ class ConvNet(nn.Module):
         Parts of this class have been forked from\
         https://github.com/Patzold/Jugend-Forscht-2021-Code
     """
+    quantizable = True  # see quantize_model()
+    
     def __init__(self, conv1_in: int, conv1_out: int, conv2_out: int, fc1_out: int, fc2_out: int, fc3_out: int):
         super().__init__()
         self.conv1 = nn.Conv2d(conv1_in, conv1_out, 2)
@@ -3381,4 +4215,14 @@ class ConvNet(nn.Module):
         x = self.dropout(F.relu(self.fc1(x)))
         x = self.dropout(F.relu(self.fc2(x)))
         x = self.fc3(x)
-        return x
\ No newline at end of file
+        return x
+
+# Models used by Pluto: weights -> (architecture, constructor arguments, input size, input channels), see export_model()
+model_specs = {
+    "models/general_1.pt": (ConvNet, (1, 6, 12, 100, 20, 2), 224, 1),
+    "models/fbm2.pt": (ConvNet, (3, 6, 12, 100, 50, 2), 224, 3),
+    "models/wa1.pt": (ConvNet, (3, 6, 12, 300, 20, 2), 224, 3),
+    "FB Models/fb1.pt": (UNET, (3, 1), 256, 3),
+    "Utility Models/imgd_2_net_1.pt": (UNET, (3, 1), 256, 3),
+    "Twitter Models/twitter_header_segmentation.pt": (UNET, (3, 1), 256, 3),
+}
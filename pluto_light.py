@@ -5,6 +5,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import cv2
 
+from pluto_ocr import TesseractBackend, get_backend, clean_text, has_tesserocr
+
 def read_image(path: str, no_BGR_correction=False):  # -> np.ndarray
     """Returns an image from a path as a numpy array
     
@@ -177,34 +179,37 @@ def expand_to_columns(image: np.ndarray, full=False, value=200):  # -> np.ndarra
         return image
 
 class PlutoObject:
+    # OCR backend used by the class, can be changed per class, instance or call (see ocr()).
+    # The Tesseract pool keeps the engine loaded in worker processes (through tesserocr, so it's only the default if that is installed),
+    # configure it with pluto_ocr.register_backend(pluto_ocr.TesseractPoolBackend(size, timeout))
+    ocr_backend = "tesseract_pool" if has_tesserocr() else "tesseract"
+    
     def __init__(self, img: np.ndarray):
         self.img = img
-        self.tesseract_path = "C:/Program Files/Tesseract-OCR/tesseract.exe"
+        self.tesseract_path = None  # None: tesseract from PATH, or the default Windows install location
     
-    def ocr(self, image=None):  # -> str
+    def ocr(self, image=None, backend=None):  # -> str
         """Preforms OCR on a given image, using ether Tesseract or EasyOCR
         
         Args:
             image: np.ndarray of the to be treated image.
+            backend: "tesseract_pool", "tesseract", "easyocr" or an OcrBackend instance, default is self.ocr_backend.
+                If tesseract_path is set, the Tesseract backends run that executable through pytesseract
         
         Returns:
             String with the raw result of the OCR library.
         
         """
         if image is None: image = self.img
-        if self.tesseract_path == "": print("Pluto WARNING - Please check if tesseract_path has been set.")
-        from pytesseract import pytesseract
+        if backend is None: backend = self.ocr_backend
+        if backend in ("tesseract", "tesseract_pool") and self.tesseract_path: backend = TesseractBackend(self.tesseract_path)
         try:
-            pytesseract.tesseract_cmd = self.tesseract_path
-            text = pytesseract.image_to_string(image)
+            text = " ".join(get_backend(backend).readtext(image))
         except Exception as e:
             print("Pluto WARNING - Error while performing OCR: ", e)
             text = ""
         return text
 
-        print("Pluto WARNING - Check if use_tesseract and use_easyocr attributes are set.")
-        return None
-
     def expand_to_rows(self, image: np.ndarray, full=False, value=200):  # -> np.ndarray
         """
         Args:
@@ -236,33 +241,7 @@ class PlutoObject:
         Returns:
             The cleaned text as String.
         """
-        out = text.replace("\n", " ")
-        out = out.replace("\x0c", "")
-        out = " ".join(out.split())
-        
-        splits = out.split(",")
-        clean_splits = []
-        
-        for phrase in splits:
-            arr = list(phrase)
-            l = len(arr)
-            start = 0
-            end = l
-            for i in range(0, l):
-                if arr[i] == " ": start += 1
-                else: break
-            for i in range(l, 0, -1):
-                if arr[i-1] == " ": end -= 1
-                else: break
-            clean_splits.append(phrase[start:end])
-        
-        out = ""
-        for phrase in clean_splits:
-            out += phrase
-            out += ", "
-        out = out[:-2]
-        
-        return out
+        return clean_text(text)
 
     def to_json(self, data: dict):
         import json
@@ -0,0 +1,480 @@
+# Pluto OCR backends
+# Shared by pluto.py & pluto_light.py, neither OCR library is imported before it's used.
+
+# MIT License
+# Copyright (c) 2022 Malik Pätzold
+
+from typing import Literal, Protocol
+import os
+import re
+import shutil
+import numpy as np
+import cv2
+
+# EasyOCR readers, created on first use (see get_reader())
+ocr_languages = ['en']
+ocr_model_dir = None
+
+class ReaderPool:
+    """EasyOCR readers keyed by language set (and model directory). Readers are created on first use and the
+    least recently used one is released when there are more than max_readers readers or more than max_bytes of model weights loaded.
+    
+    Args:
+        max_readers: maximum number of resident readers
+        max_bytes: maximum combined size of the detector & recognizer weights of the resident readers (None for no limit)
+    """
+    def __init__(self, max_readers=2, max_bytes=None):
+        import threading
+        from collections import OrderedDict
+        self.max_readers = max_readers
+        self.max_bytes = max_bytes
+        self.readers = OrderedDict()
+        self.sizes = {}
+        self.load_counts = {}
+        self.lock = threading.RLock()
+    
+    def key(self, languages=None, model_dir=None):  # -> tuple
+        # the order of the languages doesn't change the reader, except for the first one being the main language
+        languages = list(ocr_languages if languages is None else languages)
+        return (languages[0],) + tuple(sorted(set(languages[1:]) - {languages[0]})), model_dir or ocr_model_dir
+    
+    def get(self, languages=None, model_dir=None):  # -> easyocr.Reader
+        """Returns the reader for the languages, creating it (and importing easyocr) if it isn't resident
+        
+        Args:
+            languages: list of EasyOCR language codes, default is ocr_languages
+            model_dir: see configure_ocr(), default is ocr_model_dir
+        """
+        key = self.key(languages, model_dir)
+        with self.lock:
+            if key in self.readers:
+                self.readers.move_to_end(key)
+                return self.readers[key]
+            import easyocr
+            reader = easyocr.Reader(list(key[0]), model_storage_directory=key[1])
+            self.load_counts[key] = self.load_counts.get(key, 0) + 1
+            self.sizes[key] = reader_size(reader)
+            self.readers[key] = reader
+            self.evict()
+            return reader
+    
+    def evict(self):
+        """Releases least recently used readers until the limits are met again (the most recent reader always stays)
+        """
+        with self.lock:
+            evicted = False
+            while len(self.readers) > 1 and (len(self.readers) > self.max_readers or (self.max_bytes is not None and self.memory() > self.max_bytes)):
+                key, _ = self.readers.popitem(last=False)
+                del self.sizes[key]
+                evicted = True
+            if evicted: free_memory()
+    
+    def release(self, languages=None, model_dir=None, all=False):
+        """Releases the reader of the languages (the default languages if None), or every reader if all is True
+        """
+        with self.lock:
+            keys = list(self.readers) if all else [self.key(languages, model_dir)]
+            if not any(k in self.readers for k in keys): return
+            for k in keys:
+                self.readers.pop(k, None)
+                self.sizes.pop(k, None)
+        free_memory()
+    
+    def memory(self):  # -> int
+        """Combined size of the resident readers in bytes
+        """
+        return sum(self.sizes.values())
+    
+    def stats(self):  # -> dict
+        """Load counts per reader key, and whether the reader is resident
+        """
+        return {key: {"loads": self.load_counts[key], "resident": key in self.readers, "bytes": self.sizes.get(key)} for key in self.load_counts}
+
+def reader_size(reader):  # -> int
+    # size of the weights of an EasyOCR reader (detector & recognizer are torch modules)
+    size = 0
+    for net in (getattr(reader, "detector", None), getattr(reader, "recognizer", None)):
+        if hasattr(net, "parameters"): size += sum(t.numel() * t.element_size() for t in list(net.parameters()) + list(net.buffers()))
+    return size
+
+def free_memory():
+    import gc, sys
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available(): torch.cuda.empty_cache()
+
+readers = ReaderPool()
+
+def configure_ocr(languages=None, model_dir=None):
+    """Sets the default languages and model directory of the OCR reader. A loaded reader with the old configuration is released,
+    the new one is created on the next OCR call (or with preload()).
+
+    Args:
+        languages: list of EasyOCR language codes, e.g. ['en', 'de']
+        model_dir: directory the EasyOCR models are stored in. None uses EasyOCR's default (~/.EasyOCR/model)
+    """
+    global ocr_languages, ocr_model_dir
+    if languages is not None and list(languages) != ocr_languages:
+        release()
+        ocr_languages = list(languages)
+    if model_dir is not None and model_dir != ocr_model_dir:
+        readers.release(all=True)
+        ocr_model_dir = model_dir
+
+def get_reader(languages=None):  # -> easyocr.Reader
+    """Returns the process wide EasyOCR reader for the languages (default: ocr_languages), it is only created
+    (and easyocr imported) on the first call, see ReaderPool
+    """
+    return readers.get(languages)
+
+def preload(languages=None, model_dir=None):  # -> easyocr.Reader
+    """Loads the OCR reader now instead of on the first OCR call, e.g. before handling requests in a server or GUI.
+
+    Args:
+        languages, model_dir: see configure_ocr()
+
+    Returns:
+        The loaded reader
+    """
+    configure_ocr(languages, model_dir)
+    return get_reader()
+
+def release(languages=None):
+    """Drops the OCR reader of the languages (default: ocr_languages) and frees its memory, it's loaded again on the next OCR call
+    """
+    readers.release(languages)
+
+class OcrBackend(Protocol):
+    """Interface of an OCR engine. Besides the methods, every backend declares its capabilities:
+
+    Attributes:
+        name: name the backend is registered with (see get_backend())
+        batching: readtext_batched() runs several images in one call
+        same_size_batches: the images of a readtext_batched() call must have the same size (ocr_many() pads them)
+        boxes: readtext_boxes() returns the position of each text line
+        confidences: readtext_boxes() returns a real confidence per text line
+        thread_safe: readtext() may be called from several threads at once
+        recognize_only: mode="recognize" skips text detection (otherwise it is the same as "detect")
+    """
+    name: str
+    batching: bool
+    same_size_batches: bool
+    boxes: bool
+    confidences: bool
+    thread_safe: bool
+    recognize_only: bool
+
+    def config(self) -> tuple:
+        """Everything that changes the result of the backend, part of the OCR cache key"""
+        ...
+
+    def readtext(self, image: np.ndarray, mode: Literal["detect", "recognize"] = "detect", allowlist=None) -> list:
+        """The text lines / words found in the image, as list of strings. allowlist restricts the recognized characters"""
+        ...
+
+    def readtext_batched(self, images: list, batch_size=8) -> list:
+        """readtext() for a list of images of the same size"""
+        ...
+
+    def readtext_boxes(self, image: np.ndarray) -> list:
+        """List of (box, text, confidence), box being the four corner points [[x, y], ...] of the text line"""
+        ...
+
+    def with_languages(self, languages: list) -> "OcrBackend":
+        """The same backend for other languages (ISO 639-1 codes, e.g. ['de', 'en']). Optional, backends without it ignore PlutoObject.ocr_languages"""
+        ...
+
+class EasyOcrBackend:
+    """EasyOCR, using the process wide readers (see ReaderPool). Best on chat bubbles & colored backgrounds.
+    
+    Args:
+        languages: list of EasyOCR language codes, None uses ocr_languages (see configure_ocr())
+    """
+    name = "easyocr"
+    batching = True
+    same_size_batches = True
+    boxes = True
+    confidences = True
+    thread_safe = False
+    recognize_only = True
+
+    def __init__(self, languages=None):
+        self.languages = None if languages is None else list(languages)
+        self.variants = {}
+
+    def config(self):  # -> tuple
+        return (self.name, readers.key(self.languages)[0], ocr_model_dir)
+
+    def with_languages(self, languages):  # -> EasyOcrBackend
+        """The backend for other languages (ISO 639-1 codes, e.g. ['de', 'en']), instances are reused
+        """
+        key = tuple(languages)
+        if key not in self.variants: self.variants[key] = EasyOcrBackend(languages)
+        return self.variants[key]
+
+    def reader(self):  # -> easyocr.Reader
+        return readers.get(self.languages)
+
+    def readtext(self, image: np.ndarray, mode="detect", allowlist=None):  # -> list
+        if mode == "recognize": return self.reader().recognize(image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY), detail=0, allowlist=allowlist)
+        return self.reader().readtext(image, detail=0, allowlist=allowlist)
+
+    def readtext_batched(self, images: list, batch_size=8):  # -> list
+        return self.reader().readtext_batched(images, detail=0, batch_size=batch_size)
+
+    def readtext_boxes(self, image: np.ndarray):  # -> list
+        return [(np.array(box).tolist(), text, float(conf)) for box, text, conf in self.reader().readtext(image, detail=1)]
+
+class TesseractBackend:
+    """Tesseract through pytesseract, a lot faster than EasyOCR on clean, dark-on-light text (news articles).
+
+    Args:
+        cmd: path to the tesseract executable. None uses tesseract from PATH, or the default Windows install location
+        lang: Tesseract language codes, e.g. "eng" or "deu+eng"
+        config: additional command line options
+    """
+    name = "tesseract"
+    batching = False
+    same_size_batches = False
+    boxes = True
+    confidences = True
+    thread_safe = True
+    recognize_only = True
+    windows_path = "C:/Program Files/Tesseract-OCR/tesseract.exe"
+    # ISO 639-1 codes (as used by EasyOCR & PlutoObject.ocr_languages) to Tesseract language codes
+    language_codes = {"en": "eng", "de": "deu", "fr": "fra", "es": "spa", "it": "ita", "nl": "nld", "pt": "por"}
+
+    def __init__(self, cmd=None, lang="eng", config=""):
+        self.cmd = cmd
+        self.lang = lang
+        self.extra_config = config
+        self.variants = {}
+
+    def config(self):  # -> tuple
+        return (self.name, self.lang, self.extra_config)
+
+    def with_languages(self, languages):  # -> TesseractBackend
+        """The backend for other languages (ISO 639-1 codes, e.g. ['de', 'en']), instances are reused
+        """
+        lang = "+".join(self.language_codes.get(l, l) for l in languages)
+        if lang == self.lang: return self
+        if lang not in self.variants: self.variants[lang] = self.variant(lang)
+        return self.variants[lang]
+
+    def variant(self, lang):  # -> TesseractBackend
+        return TesseractBackend(self.cmd, lang, self.extra_config)
+
+    def resolve_cmd(self):  # -> str
+        if self.cmd: return self.cmd
+        if shutil.which("tesseract") is None and os.path.exists(self.windows_path): return self.windows_path
+        return "tesseract"
+
+    def tesseract(self):
+        from pytesseract import pytesseract
+        pytesseract.tesseract_cmd = self.resolve_cmd()
+        return pytesseract
+
+    def readtext(self, image: np.ndarray, mode="detect", allowlist=None):  # -> list
+        # page segmentation mode 7: the image is a single text line
+        options = (self.extra_config + " --psm 7").strip() if mode == "recognize" else self.extra_config
+        if allowlist: options += f" -c tessedit_char_whitelist={allowlist}"
+        return [self.tesseract().image_to_string(image, lang=self.lang, config=options)]
+
+    def readtext_batched(self, images: list, batch_size=8):  # -> list
+        return [self.readtext(image) for image in images]
+
+    def readtext_boxes(self, image: np.ndarray):  # -> list
+        pytesseract = self.tesseract()
+        data = pytesseract.image_to_data(image, lang=self.lang, config=self.extra_config, output_type=pytesseract.Output.DICT)
+        lines = {}
+        for i in range(len(data["text"])):
+            if not data["text"][i].strip(): continue
+            key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+            x0, y0 = data["left"][i], data["top"][i]
+            x1, y1 = x0 + data["width"][i], y0 + data["height"][i]
+            if key not in lines: lines[key] = [x0, y0, x1, y1, [], []]
+            line = lines[key]
+            line[0], line[1], line[2], line[3] = min(line[0], x0), min(line[1], y0), max(line[2], x1), max(line[3], y1)
+            line[4].append(data["text"][i])
+            line[5].append(float(data["conf"][i]) / 100)
+        return [([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], " ".join(words), float(np.mean(confs)))
+                for x0, y0, x1, y1, words, confs in lines.values()]
+
+def _tesseract_worker(conn, cmd, lang, config):
+    """Worker process of TesseractPoolBackend: loads Tesseract once, then reads (image, mode) tuples from the pipe
+    and sends the text back until it receives None
+    """
+    try:
+        from tesserocr import PyTessBaseAPI, PSM
+        api = PyTessBaseAPI(lang=lang)
+    except ImportError:
+        api = None
+        fallback = TesseractBackend(cmd, lang, config)
+    while True:
+        msg = conn.recv()
+        if msg is None: break
+        image, mode, allowlist = msg
+        try:
+            if api is None: conn.send(("ok", fallback.readtext(image, mode, allowlist)[0]))
+            else:
+                image = np.ascontiguousarray(image)
+                bpp = 1 if image.ndim == 2 else image.shape[2]
+                api.SetPageSegMode(PSM.SINGLE_LINE if mode == "recognize" else PSM.AUTO)
+                api.SetVariable("tessedit_char_whitelist", allowlist or "")
+                api.SetImageBytes(image.tobytes(), image.shape[1], image.shape[0], bpp, image.shape[1] * bpp)
+                conn.send(("ok", api.GetUTF8Text()))
+        except Exception as e: conn.send(("error", str(e)))
+    if api is not None: api.End()
+
+def has_tesserocr():  # -> bool
+    """Whether tesserocr is installed (without importing it), the Tesseract pool is only faster than
+    the "tesseract" backend with it
+    """
+    import importlib.util
+    return importlib.util.find_spec("tesserocr") is not None
+
+class TesseractPoolBackend(TesseractBackend):
+    """Tesseract in a pool of long-lived worker processes. Every worker loads the engine & language data once
+    (through tesserocr) and receives the images over a pipe, so there's no process spawn or temp file per crop.
+    Without tesserocr the workers fall back to pytesseract. Workers are started on first use.
+    
+    Args:
+        size: number of worker processes
+        timeout: seconds a worker may take for one image, after that it's restarted
+        cmd, lang, config: see TesseractBackend
+    """
+    name = "tesseract_pool"
+    batching = True
+    
+    def __init__(self, size=2, timeout=30, cmd=None, lang="eng", config=""):
+        import threading
+        super().__init__(cmd, lang, config)
+        self.lock = threading.Lock()
+        self.size = size
+        self.timeout = timeout
+        self.workers = []
+        self.idle = None
+        self.restarts = 0
+    
+    def variant(self, lang):  # -> TesseractPoolBackend
+        # a separate pool, the workers load one language set each
+        return TesseractPoolBackend(self.size, self.timeout, self.cmd, lang, self.extra_config)
+    
+    def start_worker(self):  # -> tuple
+        import multiprocessing as mp
+        # spawned, not forked: workers are also started from OcrExecutor threads of a process that has torch / OpenMP loaded
+        ctx = mp.get_context("spawn")
+        conn, child = ctx.Pipe()
+        process = ctx.Process(target=_tesseract_worker, args=(child, self.cmd, self.lang, self.extra_config), daemon=True)
+        process.start()
+        return process, conn
+    
+    def start(self):
+        """Starts the workers (done automatically on the first call)
+        """
+        import queue, atexit
+        if self.idle is not None: return
+        # readtext_batched() calls this from several threads at once, the pool must only be started once
+        with self.lock:
+            if self.idle is not None: return
+            idle = queue.Queue()
+            for i in range(self.size):
+                self.workers.append(self.start_worker())
+                idle.put(i)
+            self.idle = idle
+        atexit.register(self.close)
+    
+    def restart(self, i):
+        process, conn = self.workers[i]
+        if process.is_alive(): process.kill()
+        process.join()
+        conn.close()
+        self.workers[i] = self.start_worker()
+        self.restarts += 1
+    
+    def close(self):
+        """Stops all workers
+        """
+        with self.lock:
+            for process, conn in self.workers:
+                try: conn.send(None)
+                except (OSError, EOFError): pass
+                process.join(1)
+                if process.is_alive(): process.kill()
+            self.workers = []
+            self.idle = None
+    
+    def readtext(self, image: np.ndarray, mode="detect", allowlist=None, retry=True):  # -> list
+        self.start()
+        i = self.idle.get()
+        try:
+            process, conn = self.workers[i]
+            try:
+                conn.send((image, mode, allowlist))
+                if not conn.poll(self.timeout):
+                    self.restart(i)
+                    raise TimeoutError(f"Tesseract worker took longer than {self.timeout}s")
+                status, text = conn.recv()
+            except (OSError, EOFError):
+                # the worker crashed, the image is tried once more on the restarted worker
+                self.restart(i)
+                if not retry: raise RuntimeError("Tesseract worker crashed, it has been restarted")
+                status = None
+        finally: self.idle.put(i)
+        if status is None: return self.readtext(image, mode, allowlist, False)
+        if status != "ok": raise RuntimeError(text)
+        return [text]
+    
+    def readtext_batched(self, images: list, batch_size=8):  # -> list
+        """Reads the images in parallel, one per worker
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(self.size) as executor:
+            return list(executor.map(self.readtext, images))
+
+# OCR text post-processing, the patterns & tables are built once at import
+_delete_chars = str.maketrans("", "", "\x0c")
+_comma_spaces = re.compile(r" ?, ?")
+_not_strict = re.compile(r"[^A-Za-z ]+")
+_not_strict_digits = re.compile(r"[^A-Za-z0-9 ]+")
+
+def clean_text(text: str):  # -> str
+    """Removes \x0c, collapses whitespace (including \n) to single spaces and normalizes commas to ", "
+    """
+    return _comma_spaces.sub(", ", " ".join(text.translate(_delete_chars).split()))
+
+def clean_texts(texts):  # -> list
+    """clean_text() for a list of OCR results
+    """
+    clean = clean_text
+    return [clean(text) for text in texts]
+
+def filter_strict(text: str, allow_digits=True):  # -> str
+    """Keeps only ASCII letters, spaces (and digits), whitespace is collapsed to single spaces
+    """
+    return " ".join((_not_strict_digits if allow_digits else _not_strict).sub("", text).split())
+
+backends = {"easyocr": EasyOcrBackend, "tesseract": TesseractBackend, "tesseract_pool": TesseractPoolBackend}
+_backends = {}
+
+def register_backend(backend):  # -> OcrBackend
+    """Makes a configured backend instance the shared one for its name, e.g. register_backend(TesseractPoolBackend(size=4))
+    """
+    _backends[backend.name] = backend
+    return backend
+
+def is_shared(backend):  # -> bool
+    """True if backend is the shared instance of its name, so it can be passed as name (e.g. to another process)
+    """
+    return _backends.get(getattr(backend, "name", None)) is backend
+
+def get_backend(backend="easyocr"):  # -> OcrBackend
+    """Returns the shared instance of a registered backend, or the backend itself if an instance is passed
+
+    Args:
+        backend: name of the backend (see backends) or an OcrBackend instance
+    """
+    if not isinstance(backend, str): return backend
+    if backend not in backends: raise ValueError(f"Pluto ERROR - Unknown OCR backend: {backend}, available: {', '.join(backends)}")
+    if backend not in _backends: _backends[backend] = backends[backend]()
+    return _backends[backend]
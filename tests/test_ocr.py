@@ -0,0 +1,124 @@
+# OCR plumbing of PlutoObject (cache, concurrent reads) with a fake backend, no OCR engine needed
+# Run with: python -m pytest tests
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")  # pluto.py imports torch (and easyocr's dependencies) at module level
+import pluto as pl
+
+class FakeBackend:
+    """Reads every crop as its width, or raises if fail is set. Counts the calls
+    """
+    name = "fake"
+    batching = False
+    same_size_batches = False
+    boxes = False
+    confidences = False
+    thread_safe = True
+    recognize_only = False
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = 0
+
+    def config(self):  # -> tuple
+        return ("fake",)
+
+    def readtext(self, image, mode="detect", allowlist=None):  # -> list
+        self.calls += 1
+        if self.fail: raise RuntimeError("fake OCR failure")
+        return [str(image.shape[1])]
+
+@pytest.fixture
+def util():
+    pl.ocr_cache.clear()
+    util = pl.PlutoObject(None)
+    util.ocr_concurrent = True
+    yield util
+    pl.ocr_executor.shutdown()
+    pl.ocr_cache.clear()
+
+def test_failed_concurrent_ocr_is_not_cached(util):
+    crop = np.full((20, 60, 3), 255, np.uint8)
+    backend = FakeBackend(fail=True)
+    assert util.ocr_async(crop, backend=backend).result() == " "
+    backend.fail = False
+    assert util.ocr(crop, backend=backend) == " 60"
+    assert backend.calls == 2
+
+def test_concurrent_ocr_is_cached(util):
+    crop = np.full((20, 70, 3), 255, np.uint8)
+    backend = FakeBackend()
+    assert util.ocr_async(crop, backend=backend).result() == " 70"
+    assert util.ocr(crop, backend=backend) == " 70"
+    assert backend.calls == 1
+
+class FakeBatchingBackend(FakeBackend):
+    """Reads lists of crops in one call, records the sizes it was given
+    """
+    name = "fake_batching"
+    batching = True
+
+    def __init__(self, same_size_batches):
+        super().__init__()
+        self.same_size_batches = same_size_batches
+        self.shapes = []
+
+    def readtext_batched(self, images, batch_size=8):  # -> list
+        self.shapes += [image.shape[:2] for image in images]
+        return [self.readtext(image) for image in images]
+
+@pytest.mark.parametrize("same_size_batches", [True, False])
+def test_ocr_many_pads_only_same_size_batches(util, same_size_batches):
+    crops = [np.full((5 + 5 * i, 20 + 20 * i, 3), 40 * i, np.uint8) for i in range(3)]
+    backend = FakeBatchingBackend(same_size_batches)
+    util.ocr_many(crops, mode="detect", backend=backend)
+    if same_size_batches: assert backend.shapes == [(15, 60)] * 3
+    else: assert sorted(backend.shapes) == [c.shape[:2] for c in crops]
+    # unpadded results are the ones ocr() would read, so they are shared with it, padded ones are not
+    calls = backend.calls
+    assert util.ocr(crops[0], mode="detect", backend=backend) == " 20"
+    assert backend.calls == calls + (1 if same_size_batches else 0)
+
+class FakeBoxesBackend(FakeBackend):
+    """Knows the text lines of one screenshot. Crops of it are read as the characters of the lines they cover
+    (evenly spaced over the box), the screenshot itself with text boxes
+    """
+    name = "fake_boxes"
+    boxes = True
+
+    def __init__(self, screenshot, lines):
+        super().__init__()
+        self.screenshot = screenshot
+        self.lines = lines  # (x0, y0, x1, y1, text)
+
+    def readtext(self, image, mode="detect", allowlist=None):  # -> list
+        y0, y1, x0, x1 = pl.locate_view(image, self.screenshot)
+        out = []
+        for lx0, ly0, lx1, ly1, text in self.lines:
+            if not y0 <= (ly0 + ly1) / 2 < y1 or x1 <= lx0 or x0 >= lx1: continue
+            width = (lx1 - lx0) / len(text)
+            out.append(text[int(max(x0 - lx0, 0) / width):int(np.ceil((min(x1, lx1) - lx0) / width))])
+        return out
+
+    def readtext_boxes(self, image):  # -> list
+        return [([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], text, 0.9) for x0, y0, x1, y1, text in self.lines]
+
+@pytest.mark.parametrize("token", ["@", "By ", "name", "Doe"])
+@pytest.mark.parametrize("start", [True, False])
+def test_probe_single_pass_matches_per_crop(token, start):
+    screenshot = np.full((120, 400, 3), 255, np.uint8)
+    lines = [(4, 10, 300, 30, "@user name"), (4, 50, 380, 70, "By John Doe"), (40, 90, 200, 110, "reply")]
+    # the boxes get distinct pixels, ocr_cache tells crops apart by content
+    for i, (x0, y0, x1, y1, text) in enumerate(lines): screenshot[y0:y1, x0:x1] = 40 * i
+    backend = FakeBoxesBackend(screenshot, lines)
+    crops = [screenshot[5:35], screenshot[45:75], screenshot[85:115]]
+    found = {}
+    for single_pass in (False, True):
+        pl.ocr_cache.clear()
+        util = pl.PlutoObject(screenshot)
+        util.single_pass = single_pass
+        found[single_pass] = [util.probe(crop, token, start, backend) for crop in crops]
+    pl.ocr_cache.clear()
+    assert found[True] == found[False]
@@ -0,0 +1,72 @@
+# Equivalence of the vectorized trimm_and_blur() with the per-pixel loop it replaced, on every example image
+# Run with: python -m pytest tests
+
+import glob
+import os
+
+import numpy as np
+import cv2
+import pytest
+
+pytest.importorskip("torch")  # pluto.py imports torch (and easyocr's dependencies) at module level
+import pluto as pl
+
+IMAGES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "..", "example images", "*.jpg")))
+
+# (less, value, blurs, trimm, double_down, invert, remove_color, remove_value), as used by the classes
+PARAMS = [
+    (True, 20, (3, 3), [255, 255, 255], False, None, False, [0, 0, 0]),
+    (True, 20, (3, 3), [255, 255, 255], True, [0, 0, 0], False, [0, 0, 0]),
+    (False, 60, (30, 30), [0, 0, 0], False, None, False, [0, 0, 0]),
+    (False, 30, (20, 20), [255, 255, 255], True, [0, 0, 0], False, [0, 0, 0]),
+    (True, 245, (20, 20), [255, 255, 255], True, [0, 0, 0], False, [0, 0, 0]),
+    (False, 55, (15, 15), [255, 255, 255], True, [0, 0, 0], False, [0, 0, 0]),
+    (True, 10, (5, 5), [255, 255, 255], False, None, True, [0, 0, 0]),
+    (False, 200, (5, 5), [0, 0, 0], True, [255, 255, 255], True, [128, 128, 128]),
+]
+
+def reference(inpt, less, value, blurs, trimm, double_down=False, invert=None, remove_color=False, remove_value=np.ndarray([0,0,0])):
+    # the per-pixel loop of trimm_and_blur() before it was vectorized
+    for i in range(len(inpt)):
+        for j in range(len(inpt[i])):
+            if remove_color:
+                if np.max(inpt[i][j]) - np.min(inpt[i][j]) > 2:
+                    inpt[i][j] = remove_value
+            if less:
+                if inpt[i][j][0] > value or inpt[i][j][1] > value or inpt[i][j][2] > value:
+                    inpt[i][j] = np.array(trimm)
+                elif double_down:
+                    inpt[i][j] = np.array(invert)
+            else:
+                if inpt[i][j][0] < value or inpt[i][j][1] < value or inpt[i][j][2] < value:
+                    inpt[i][j] = np.array(trimm)
+                elif double_down:
+                    inpt[i][j] = np.array(invert)
+    blur = cv2.blur(inpt, blurs)
+    return blur
+
+def load(path):
+    # the loop takes minutes on full size screenshots, a downscaled copy keeps every color & edge case
+    img = pl.read_image(path)
+    return cv2.resize(img, (96, int(img.shape[0] * 96 / img.shape[1])), interpolation=cv2.INTER_NEAREST)
+
+def test_example_images_found():
+    assert len(IMAGES) > 0
+
+@pytest.mark.parametrize("path", IMAGES, ids=os.path.basename)
+@pytest.mark.parametrize("params", PARAMS)
+def test_trimm_and_blur_matches_loop(path, params):
+    img = load(path)
+    expected = reference(img.copy(), *params)
+    original = img.copy()
+    result = pl.trimm_and_blur(img, *params)
+    assert np.array_equal(result, expected)
+    assert np.array_equal(img, original)  # the input isn't modified
+
+@pytest.mark.parametrize("path", IMAGES, ids=os.path.basename)
+def test_trimm_and_blur_out_buffer(path):
+    img = load(path)
+    out = np.empty_like(img)
+    result = pl.trimm_and_blur(img, False, 30, (20, 20), [255, 255, 255], True, [0, 0, 0], out=out)
+    assert result is out
+    assert np.array_equal(out, reference(img.copy(), False, 30, (20, 20), [255, 255, 255], True, [0, 0, 0]))